@@ -6,8 +6,10 @@ This allows existing users to run `python dex.py` as before while using the new
 
 import asyncio
 import sys
+import time
 
 from dexscraper import DexScraper
+from dexscraper.utils import exponential_backoff, run_async, write_json_line
 
 
 async def main() -> None:
@@ -19,14 +21,14 @@ async def main() -> None:
 
     # Stream tokens using the new extraction method
     async def stream_tokens() -> None:
+        now = time.time
+        failures = 0
+
         while True:
             try:
                 batch = await scraper.extract_token_data()
                 if batch.tokens:
                     # Output in original JSON format
-                    import json
-                    import time
-
                     output = {
                         "type": "tokens",
                         "extracted": batch.total_extracted,
@@ -34,23 +36,32 @@ async def main() -> None:
                         "tokens": [
                             token.to_dict() for token in batch.get_top_tokens(10)
                         ],
-                        "timestamp": int(time.time()),
+                        "timestamp": int(now()),
                     }
-                    print(json.dumps(output, separators=(",", ":"), default=str))
+                    # One write per batch; flush so pipe consumers see it now
+                    write_json_line(output)
 
+                failures = 0
                 # Wait between extractions (similar to original streaming)
                 await asyncio.sleep(5)
 
             except Exception as e:
-                print(f"Extraction error: {e}", file=sys.stderr)
-                await asyncio.sleep(10)
+                # Back off from 10s up to a minute, with ±25% jitter
+                delay = exponential_backoff(
+                    failures, base_delay=10.0, max_delay=60.0, jitter=0.25
+                )
+                failures += 1
+                print(
+                    f"Extraction error: {e} (retrying in {delay:.1f}s)", file=sys.stderr
+                )
+                await asyncio.sleep(delay)
 
     await stream_tokens()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_async(main())
     except KeyboardInterrupt:
         print("\nStopped by user", file=sys.stderr)
         sys.exit(0)
@@ -2,19 +2,21 @@
 
 import argparse
 import asyncio
-import json
 import sys
 import time
+from bisect import bisect_right
 from datetime import datetime
-from typing import Callable, Optional
+from functools import cached_property
+from typing import Any, Callable, Optional, Union
 
 # Rich types will be imported in the try block below
 
 try:
     from rich.align import Align
     from rich.columns import Columns
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.layout import Layout
+    from rich.live import Live
     from rich.padding import Padding
     from rich.panel import Panel
     from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -35,6 +37,18 @@ except ImportError:
     class Layout:  # type: ignore[no-redef]
         pass
 
+    class Group:  # type: ignore[no-redef]
+        pass
+
+    class Align:  # type: ignore[no-redef]
+        pass
+
+    class Rule:  # type: ignore[no-redef]
+        pass
+
+    class Text:  # type: ignore[no-redef]
+        pass
+
     RICH_AVAILABLE = False
 
 from .config import (
@@ -49,6 +63,38 @@ from .config import (
 )
 from .models import ExtractedTokenBatch, TokenProfile, TradingPair
 from .scraper import DexScraper
+from .utils import (
+    exponential_backoff,
+    json_dumps_bytes,
+    run_async,
+    write_json_line,
+    write_lines,
+)
+
+
+STREAM_MODE_TITLE = "[bright_magenta]📺 Live Stream Mode[/bright_magenta]"
+# Seconds between live stream frames
+STREAM_REFRESH_SECONDS = 5.0
+
+# Enum values listed in --help and argument errors
+CHAIN_CHOICES = [c.value for c in Chain]
+TIMEFRAME_CHOICES = [t.value for t in Timeframe]
+RANK_BY_CHOICES = [r.value for r in RankBy]
+DEX_CHOICES = [d.value for d in DEX]
+
+# Confidence score bands and the icon shown for each in the token table
+CONFIDENCE_THRESHOLDS = (0.4, 0.6, 0.8)
+CONFIDENCE_ICONS = ("🔴", "🟡", "⭐", "⚡")
+
+# Column headers and options for the token table, shared by every refresh
+TOKEN_TABLE_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Token", {"style": "bright_white bold", "width": 16}),
+    ("Price", {"style": "bright_green", "justify": "right", "width": 12}),
+    ("Volume", {"style": "bright_blue", "justify": "right", "width": 10}),
+    ("Txns", {"style": "bright_yellow", "justify": "right", "width": 8}),
+    ("Makers", {"style": "magenta", "justify": "right", "width": 8}),
+    ("Conf", {"style": "bright_magenta", "justify": "center", "width": 6}),
+)
 
 # ASCII Ghost Art for loading screen
 GHOST_ASCII = """
@@ -84,21 +130,42 @@ class SlickCLI:
         self.use_cloudflare_bypass = use_cloudflare_bypass
         self.debug = debug
 
+    # Static renderables, built on first use and reused by every frame so
+    # callback-only instances never pay for them
+
+    @cached_property
+    def _ghost_art(self) -> Align:
+        return Align.center(Text.from_markup(GHOST_ASCII))
+
+    @cached_property
+    def _header_panel(self) -> Panel:
+        return self.create_header_panel()
+
+    @cached_property
+    def _stream_rule(self) -> Rule:
+        return Rule(STREAM_MODE_TITLE, style="bright_magenta")
+
+    @cached_property
+    def _stream_hint(self) -> Text:
+        return Text.from_markup(
+            "\n[bright_black]Press Ctrl+C to return to menu...[/bright_black]"
+        )
+
     def clear_screen(self) -> None:
         """Clear terminal screen."""
         self.console.clear()
 
-    def show_ghost_loading(self) -> None:
+    async def show_ghost_loading(self) -> None:
         """Show ASCII ghost with loading animation."""
         self.clear_screen()
 
         with self.console.status(
             "[primary]Initializing Ghost Protocol...", spinner="dots"
         ):
-            time.sleep(2)
+            await asyncio.sleep(2)
 
-        self.console.print(Align.center(GHOST_ASCII))
-        time.sleep(1.5)
+        self.console.print(self._ghost_art)
+        await asyncio.sleep(1.5)
 
     def show_main_menu(self) -> str:
         """Display main menu with options."""
@@ -146,7 +213,7 @@ class SlickCLI:
             default="1",
         )
 
-    async def extract_data(self) -> ExtractedTokenBatch:
+    async def extract_data(self, show_progress: bool = True) -> ExtractedTokenBatch:
         """Extract token data with progress animation."""
         if not self.scraper:
             self.scraper = DexScraper(
@@ -155,6 +222,10 @@ class SlickCLI:
             )
         scraper = self.scraper
 
+        # A spinner can't run inside an active Live display
+        if not show_progress:
+            return await scraper.extract_token_data()
+
         with Progress(
             SpinnerColumn("dots"),
             TextColumn("[bright_magenta]Extracting ghost data..."),
@@ -177,42 +248,28 @@ class SlickCLI:
         )
 
         # Slick columns with standard colors
-        table.add_column("Token", style="bright_white bold", width=16)
-        table.add_column("Price", style="bright_green", justify="right", width=12)
-        table.add_column("Volume", style="bright_blue", justify="right", width=10)
-        table.add_column("Txns", style="bright_yellow", justify="right", width=8)
-        table.add_column("Makers", style="magenta", justify="right", width=8)
-        table.add_column("Conf", style="bright_magenta", justify="center", width=6)
+        for header, column_options in TOKEN_TABLE_COLUMNS:
+            table.add_column(header, **column_options)
 
         # Get tokens with proper names
         top_tokens = batch.get_top_tokens(10)
+        display_name = self.get_token_display_name
+        format_volume = self.format_large_number
+        add_row = table.add_row
 
         for i, token in enumerate(top_tokens):
-            # Extract proper token name or use fallback
-            name = self.get_token_display_name(token, i)
-
             # Format values with proper styling
             price = f"${token.price:.6f}" if token.price else "N/A"
-            volume = (
-                self.format_large_number(token.volume_24h)
-                if token.volume_24h
-                else "N/A"
-            )
+            volume = format_volume(token.volume_24h) if token.volume_24h else "N/A"
             txns = f"{int(token.txns_24h):,}" if token.txns_24h else "N/A"
             makers = f"{int(token.makers):,}" if token.makers else "N/A"
 
             # Confidence with emoji
-            conf_score = token.confidence_score or 0
-            if conf_score >= 0.8:
-                conf = "⚡"
-            elif conf_score >= 0.6:
-                conf = "⭐"
-            elif conf_score >= 0.4:
-                conf = "🟡"
-            else:
-                conf = "🔴"
+            conf = CONFIDENCE_ICONS[
+                bisect_right(CONFIDENCE_THRESHOLDS, token.confidence_score or 0)
+            ]
 
-            table.add_row(name, price, volume, txns, makers, conf)
+            add_row(display_name(token, i), price, volume, txns, makers, conf)
 
         return table
 
@@ -240,55 +297,48 @@ class SlickCLI:
         else:
             return f"${num:.0f}"
 
+    def create_stream_frame(self, batch: ExtractedTokenBatch) -> Group:
+        """Create one live stream frame: banner, stats line, table and hint."""
+        stats = Text.assemble(
+            ("👻 ", "bright_magenta"),
+            (f"Extracted: {batch.total_extracted} | ", "bright_white"),
+            (f"High Conf: {batch.high_confidence_count} | ", "bright_green"),
+            (f"Time: {datetime.now().strftime('%H:%M:%S')}", "bright_blue"),
+        )
+        return Group(
+            self._stream_rule,
+            Padding(stats, (0, 0, 1, 0)),
+            self.create_slick_token_table(batch),
+            self._stream_hint,
+        )
+
     async def stream_mode(self) -> None:
         """Live streaming mode."""
         self.clear_screen()
-        self.console.print(
-            Rule(
-                "[bright_magenta]📺 Live Stream Mode[/bright_magenta]",
-                style="bright_magenta",
-            )
-        )
+        self.console.print(self._stream_rule)
         self.console.print()
 
         try:
-            while True:
-                batch = await self.extract_data()
-
-                # Clear and show data
-                self.clear_screen()
-                self.console.print(
-                    Rule(
-                        "[bright_magenta]📺 Live Stream Mode[/bright_magenta]",
-                        style="bright_magenta",
+            batch = await self.extract_data()
+
+            # Redraw in place only when new data arrives, every 5 seconds
+            with Live(
+                self.create_stream_frame(batch),
+                console=self.console,
+                screen=True,
+                auto_refresh=False,
+            ) as live:
+                fetch_seconds = 0.0
+                while True:
+                    # Start fetching early enough that the batch lands on the
+                    # refresh deadline, so each frame shows just-fetched data
+                    await asyncio.sleep(STREAM_REFRESH_SECONDS - fetch_seconds)
+                    started = time.monotonic()
+                    batch = await self.extract_data(show_progress=False)
+                    fetch_seconds = min(
+                        time.monotonic() - started, STREAM_REFRESH_SECONDS
                     )
-                )
-
-                # Stats header
-                stats = Text()
-                stats.append("👻 ", style="bright_magenta")
-                stats.append(
-                    f"Extracted: {batch.total_extracted} | ", style="bright_white"
-                )
-                stats.append(
-                    f"High Conf: {batch.high_confidence_count} | ", style="bright_green"
-                )
-                stats.append(
-                    f"Time: {datetime.now().strftime('%H:%M:%S')}", style="bright_blue"
-                )
-
-                self.console.print(Padding(stats, (0, 0, 1, 0)))
-
-                # Token table
-                table = self.create_slick_token_table(batch)
-                self.console.print(table)
-
-                self.console.print(
-                    "\n[bright_black]Press Ctrl+C to return to menu...[/bright_black]"
-                )
-
-                # Wait 5 seconds
-                await asyncio.sleep(5)
+                    live.update(self.create_stream_frame(batch), refresh=True)
 
         except KeyboardInterrupt:
             self.console.print("\n[bright_yellow]Returning to menu...[/bright_yellow]")
@@ -332,25 +382,20 @@ class SlickCLI:
         # Extract and save
         batch = await self.extract_data()
 
+        content: Union[str, bytes]
         if choice == "1":  # JSON
-            import json
-
             data = [token.__dict__ for token in batch.tokens]
-            with open(filename, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            content = json_dumps_bytes(data, indent=True)
         elif choice == "2":  # CSV
             content = batch.to_csv_string("basic")
-            with open(filename, "w") as f:
-                f.write(content)
         elif choice == "3":  # MT5
             ohlc_batch = batch.to_ohlc_batch()
             content = "\n".join([ohlc.to_mt5_format() for ohlc in ohlc_batch])
-            with open(filename, "w") as f:
-                f.write(content)
-        elif choice == "4":  # OHLCV
+        else:  # OHLCV
             content = batch.to_csv_string("ohlcv")
-            with open(filename, "w") as f:
-                f.write(content)
+
+        # Keep disk I/O off the event loop
+        await asyncio.to_thread(write_file, filename, content)
 
         self.console.print(f"\n[bright_green]✓ Exported to: {filename}[/bright_green]")
         self.console.print(
@@ -362,7 +407,7 @@ class SlickCLI:
     async def run(self) -> None:
         """Main application loop."""
         # Show loading screen
-        self.show_ghost_loading()
+        await self.show_ghost_loading()
 
         if self.use_cloudflare_bypass:
             if not self.scraper:
@@ -396,29 +441,32 @@ class SlickCLI:
                 self.console.print(
                     Align.center("[dim white]👻 Fading into the void...[/dim white]")
                 )
-                time.sleep(1)
+                await asyncio.sleep(1)
                 break
 
     def create_header_panel(self) -> Panel:
         """Create sophisticated header with branding."""
 
-        header_text = Text()
-        header_text.append("🔷 ", style="bright_blue")
-        header_text.append("DEXSCRAPER", style="bold bright_white")
-        header_text.append(" PRO", style="bold gold1")
-        header_text.append(" 🔷", style="bright_blue")
-        header_text.append("\n")
-        header_text.append(
-            "Real-time DeFi Market Intelligence", style="italic bright_blue"
+        header_text = Text.assemble(
+            ("🔷 ", "bright_blue"),
+            ("DEXSCRAPER", "bold bright_white"),
+            (" PRO", "bold gold1"),
+            (" 🔷", "bright_blue"),
+            "\n",
+            ("Real-time DeFi Market Intelligence", "italic bright_blue"),
         )
 
         return Panel(Align.center(header_text), border_style="gold1", padding=(0, 1))
 
-    def create_stats_panel(self, batch: ExtractedTokenBatch) -> Panel:
-        """Create enhanced statistics panel."""
+    def create_stats_panel(
+        self, batch: ExtractedTokenBatch, now: Optional[float] = None
+    ) -> Panel:
+        """Create enhanced statistics panel as of ``now`` (default: current time)."""
+        if now is None:
+            now = time.time()
 
         # Calculate session metrics
-        session_duration = time.time() - self.session_start
+        session_duration = now - self.session_start
         extraction_rate = self.extraction_count / max(
             session_duration / 60, 0.1
         )  # per minute
@@ -454,8 +502,15 @@ class SlickCLI:
         right_stats.append("💎 ", style="bright_green")
         right_stats.append("MARKET\n", style="bold bright_white")
 
-        # Calculate total volume
-        total_vol = sum(t.volume_24h for t in batch.tokens if t.volume_24h) or 0
+        # Total volume and average confidence in one pass over the tokens
+        total_vol = 0.0
+        conf_sum = 0.0
+        for token in batch.tokens:
+            if token.volume_24h:
+                total_vol += token.volume_24h
+            conf_sum += token.confidence_score
+        avg_conf = conf_sum / max(len(batch.tokens), 1)
+
         if total_vol >= 1_000_000:
             vol_str = f"${total_vol / 1_000_000:.1f}M"
         else:
@@ -465,16 +520,12 @@ class SlickCLI:
         right_stats.append(f"{vol_str}", style="bold bright_green")
         right_stats.append("\n")
 
-        # Average confidence
-        avg_conf = sum(t.confidence_score for t in batch.tokens) / max(
-            len(batch.tokens), 1
-        )
         right_stats.append("Avg Conf: ", style="bright_white")
         right_stats.append(f"{avg_conf:.0%}", style="bold gold1")
         right_stats.append("\n")
 
         # Current time
-        current_time = datetime.now().strftime("%H:%M:%S")
+        current_time = time.strftime("%H:%M:%S", time.localtime(now))
         right_stats.append("Time: ", style="bright_white")
         right_stats.append(f"{current_time}", style="bold bright_blue")
 
@@ -498,8 +549,6 @@ class SlickCLI:
     def create_footer_panel(self, batch: ExtractedTokenBatch) -> Panel:
         """Create informative footer panel."""
 
-        footer_text = Text()
-
         # Status indicators
         if batch.high_confidence_count >= 15:
             status = "[bold bright_green]🟢 EXCELLENT[/bold bright_green]"
@@ -508,11 +557,13 @@ class SlickCLI:
         else:
             status = "[bold red]🔴 POOR[/bold red]"
 
-        footer_text.append(f"Data Quality: {status} | ")
-        footer_text.append("Press ", style="bright_white")
-        footer_text.append("Ctrl+C", style="bold bright_red")
-        footer_text.append(" to exit | ", style="bright_white")
-        footer_text.append("🔄 Auto-refresh: 5s", style="bright_cyan")
+        footer_text = Text.assemble(
+            f"Data Quality: {status} | ",
+            ("Press ", "bright_white"),
+            ("Ctrl+C", "bold bright_red"),
+            (" to exit | ", "bright_white"),
+            ("🔄 Auto-refresh: 5s", "bright_cyan"),
+        )
 
         return Panel(
             Align.center(footer_text), border_style="dim white", padding=(0, 1)
@@ -531,37 +582,46 @@ class SlickCLI:
         )
 
         # Populate sections
-        layout["header"].update(self.create_header_panel())
+        layout["header"].update(self._header_panel)
         layout["stats"].update(self.create_stats_panel(batch))
         layout["content"].update(self.create_slick_token_table(batch))
         layout["footer"].update(self.create_footer_panel(batch))
 
         return layout
 
-    def show_startup_animation(self) -> None:
+    async def show_startup_animation(self) -> None:
         """Show startup animation."""
 
-        startup_text = Text()
-        startup_text.append("🚀 ", style="bright_blue")
-        startup_text.append("INITIALIZING DEXSCRAPER PRO", style="bold bright_white")
-        startup_text.append(" 🚀", style="bright_blue")
-        startup_text.append("\n\n")
-        startup_text.append(
-            "Connecting to DexScreener WebSocket...", style="bright_cyan"
+        startup_text = Text.assemble(
+            ("🚀 ", "bright_blue"),
+            ("INITIALIZING DEXSCRAPER PRO", "bold bright_white"),
+            (" 🚀", "bright_blue"),
+            "\n\n",
+            ("Connecting to DexScreener WebSocket...", "bright_cyan"),
         )
 
         with self.console.status(startup_text, spinner="dots12") as status:
-            time.sleep(2)
+            await asyncio.sleep(2)
             status.update("Establishing binary protocol connection...")
-            time.sleep(1)
+            await asyncio.sleep(1)
             status.update("Loading market data feed...")
-            time.sleep(1)
+            await asyncio.sleep(1)
 
         self.console.print(
             "\n[bold bright_green]✅ CONNECTION ESTABLISHED[/bold bright_green]"
         )
         self.console.print("[bright_cyan]Ready for live market data...[/bright_cyan]\n")
-        time.sleep(1)
+        await asyncio.sleep(1)
+
+
+def write_file(path: str, content: Union[str, bytes]) -> None:
+    """Write text or bytes to a file, replacing any existing content."""
+    if isinstance(content, bytes):
+        with open(path, "wb") as f:
+            f.write(content)
+    else:
+        with open(path, "w") as f:
+            f.write(content)
 
 
 def create_callback(format_type: str) -> Callable[[list[TradingPair]], None]:
@@ -571,26 +631,24 @@ def create_callback(format_type: str) -> Callable[[list[TradingPair]], None]:
 
     def callback(pairs: list[TradingPair]) -> None:
         if format_type == "json":
-            import json
-
             output = {
                 "type": "pairs",
                 "pairs": [pair.to_dict() for pair in pairs],
                 "timestamp": int(time.time()),
             }
-            print(json.dumps(output, separators=(",", ":")))
+            write_json_line(output)
         elif format_type == "ohlc":
+            lines = []
             for pair in pairs:
                 ohlc = pair.to_ohlc()
                 if ohlc:
-                    print(
+                    lines.append(
                         f"{pair.base_token_symbol},{ohlc.timestamp},{ohlc.open},{ohlc.high},{ohlc.low},{ohlc.close},{ohlc.volume}"
                     )
+            write_lines(lines)
         elif format_type == "mt5":
-            for pair in pairs:
-                ohlc = pair.to_ohlc()
-                if ohlc:
-                    print(ohlc.to_mt5_format())
+            ohlc_rows = (pair.to_ohlc() for pair in pairs)
+            write_lines([ohlc.to_mt5_format() for ohlc in ohlc_rows if ohlc])
         elif format_type == "rich" and RICH_AVAILABLE and rich_display:
             # Convert pairs to token batch for rich display
             tokens = [
@@ -626,8 +684,6 @@ def create_token_callback(
 
     def callback(batch: ExtractedTokenBatch) -> None:
         if format_type == "json":
-            import json
-
             output = {
                 "type": "enhanced_tokens",
                 "extraction_timestamp": batch.extraction_timestamp,
@@ -637,7 +693,7 @@ def create_token_callback(
                     token.to_output_dict() for token in batch.get_top_tokens(limit)
                 ],
             }
-            print(json.dumps(output, separators=(",", ":"), default=str))
+            write_json_line(output)
         elif format_type == "ohlcv":
             batch_csv = batch.to_csv_string("ohlcv")
             print(batch_csv)
@@ -652,14 +708,15 @@ def create_token_callback(
                 console.print(layout)
         else:
             # Fallback to simple text output
-            print(
+            lines = [
                 f"📊 Extracted {batch.total_extracted} tokens, {batch.high_confidence_count} high-confidence"
-            )
+            ]
             for token in batch.get_top_tokens(min(limit, 10)):
                 if token.price:
-                    print(
+                    lines.append(
                         f"  {token.get_display_name()}: ${token.price:.8f} | Vol: ${token.volume_24h:,.0f}"
                     )
+            write_lines(lines)
 
     return callback
 
@@ -679,7 +736,7 @@ def build_batch_output(
             "high_confidence_count": batch.high_confidence_count,
             "tokens": [token.to_output_dict() for token in tokens],
         }
-        return json.dumps(payload, separators=(",", ":"), default=str)
+        return json_dumps_bytes(payload).decode("utf-8")
 
     if format_type == "ohlcv":
         return limited_batch.to_csv_string("ohlcv")
@@ -731,7 +788,7 @@ def parse_chain(value: str) -> Chain:
         return Chain(value.lower())
     except ValueError:
         raise argparse.ArgumentTypeError(
-            f"Invalid chain: {value}. Choose from: {[c.value for c in Chain]}"
+            f"Invalid chain: {value}. Choose from: {CHAIN_CHOICES}"
         )
 
 
@@ -741,7 +798,7 @@ def parse_timeframe(value: str) -> Timeframe:
         return Timeframe(value.lower())
     except ValueError:
         raise argparse.ArgumentTypeError(
-            f"Invalid timeframe: {value}. Choose from: {[t.value for t in Timeframe]}"
+            f"Invalid timeframe: {value}. Choose from: {TIMEFRAME_CHOICES}"
         )
 
 
@@ -751,7 +808,7 @@ def parse_rank_by(value: str) -> RankBy:
         return RankBy(value)
     except ValueError:
         raise argparse.ArgumentTypeError(
-            f"Invalid rank method: {value}. Choose from: {[r.value for r in RankBy]}"
+            f"Invalid rank method: {value}. Choose from: {RANK_BY_CHOICES}"
         )
 
 
@@ -763,7 +820,7 @@ def parse_dex_list(value: str) -> list[DEX]:
             dexs.append(DEX(dex_str.strip().lower()))
         except ValueError:
             raise argparse.ArgumentTypeError(
-                f"Invalid DEX: {dex_str}. Choose from: {[d.value for d in DEX]}"
+                f"Invalid DEX: {dex_str}. Choose from: {DEX_CHOICES}"
             )
     return dexs
 
@@ -942,7 +999,7 @@ Examples:
         "--chain",
         type=parse_chain,
         default=Chain.SOLANA,
-        help=f"Blockchain to scrape (default: solana). Options: {[c.value for c in Chain]}",
+        help=f"Blockchain to scrape (default: solana). Options: {CHAIN_CHOICES}",
     )
     parser.add_argument(
         "--chains",
@@ -954,14 +1011,14 @@ Examples:
         "-t",
         type=parse_timeframe,
         default=Timeframe.H24,
-        help=f"Timeframe (default: h24). Options: {[t.value for t in Timeframe]}",
+        help=f"Timeframe (default: h24). Options: {TIMEFRAME_CHOICES}",
     )
 
     # Ranking and sorting
     parser.add_argument(
         "--rank-by",
         type=parse_rank_by,
-        help=f"Ranking method. Options: {[r.value for r in RankBy]}",
+        help=f"Ranking method. Options: {RANK_BY_CHOICES}",
     )
     parser.add_argument(
         "--order",
@@ -974,7 +1031,7 @@ Examples:
     parser.add_argument(
         "--dex",
         type=lambda x: DEX(x.lower()),
-        help=f"Single DEX filter. Options: {[d.value for d in DEX]}",
+        help=f"Single DEX filter. Options: {DEX_CHOICES}",
     )
     parser.add_argument(
         "--dexs", type=parse_dex_list, help="Multiple DEX filters (comma-separated)"
@@ -1052,6 +1109,8 @@ Examples:
     # Initialize scraper
     scraper = DexScraper(
         debug=args.debug,
+        rate_limit=args.rate_limit,
+        max_retries=args.max_retries,
         config=config,
         use_cloudflare_bypass=args.cloudflare_bypass,
     )
@@ -1081,16 +1140,28 @@ Examples:
         callback = create_token_callback(args.format, args.limit)
 
         async def token_stream() -> None:
+            failures = 0
             while True:
+                # One connection serves pushed frames until it drops; the
+                # scraper parses one per interval and ends when pushes stop
+                batches = scraper.stream_token_batches(interval=5.0)
                 try:
-                    batch = await scraper.extract_token_data()
-                    if batch.tokens:
-                        callback(batch)
-                    await asyncio.sleep(5)  # Wait between extractions
+                    async for batch in batches:
+                        failures = 0
+                        if batch.tokens:
+                            callback(batch)
                 except Exception as e:
                     if args.debug:
                         print(f"Extraction error: {e}", file=sys.stderr)
-                    await asyncio.sleep(10)  # Wait longer on error
+                    # Back off from 10s up to a minute, with ±25% jitter
+                    await asyncio.sleep(
+                        exponential_backoff(
+                            failures, base_delay=10.0, max_delay=60.0, jitter=0.25
+                        )
+                    )
+                    failures += 1
+                finally:
+                    await batches.aclose()
 
         await token_stream()
 
@@ -1098,7 +1169,7 @@ Examples:
 def cli_main() -> None:
     """Entry point for console scripts."""
     try:
-        asyncio.run(main())
+        run_async(main())
     except KeyboardInterrupt:
         print("\nStopped by user", file=sys.stderr)
         sys.exit(0)
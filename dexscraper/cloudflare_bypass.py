@@ -3,14 +3,20 @@
 import asyncio
 from importlib.metadata import PackageNotFoundError, version as package_version
 import logging
+import random
 import re
 import time
 from typing import Any, Optional
 
 import cloudscraper
 
+from .utils import exponential_backoff
+
 logger = logging.getLogger(__name__)
 
+# Session refreshes to attempt after the first main-site request fails
+_SESSION_RETRIES = 2
+
 
 class CloudflareBypass:
     """Handle Cloudflare protection bypass for WebSocket connections."""
@@ -22,6 +28,8 @@ class CloudflareBypass:
         self.supports_v3 = self.cloudscraper_major >= 3
         self.scraper = self._create_scraper()
         self._session_cookies: dict[str, str] = {}
+        # Joined once per cookie refresh instead of on every connection
+        self._cookie_header = ""
         self._last_session_update: float = 0.0
         self._session_ttl = 180 if self.supports_v3 else 300
 
@@ -66,6 +74,7 @@ class CloudflareBypass:
     def _refresh_session(self) -> None:
         """Reset cookies and rotate to a fresh scraper session."""
         self._session_cookies = {}
+        self._cookie_header = ""
         self._last_session_update = 0.0
         try:
             self.scraper.cookies.clear()
@@ -75,13 +84,15 @@ class CloudflareBypass:
         self.scraper = self._create_scraper()
 
     async def _fetch_main_site(self, main_site_url: str) -> Optional[Any]:
-        """Run the blocking cloudscraper request in an executor."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._make_request, main_site_url)
+        """Run the blocking cloudscraper request in a worker thread."""
+        return await asyncio.to_thread(self._make_request, main_site_url)
 
     def _store_session_cookies(self) -> dict[str, str]:
         """Persist latest cookies from scraper state."""
         self._session_cookies = dict(self.scraper.cookies)
+        self._cookie_header = "; ".join(
+            [f"{k}={v}" for k, v in self._session_cookies.items()]
+        )
         self._last_session_update = time.time()
         logger.debug("Got %d cookies", len(self._session_cookies))
         return self._session_cookies
@@ -125,13 +136,23 @@ class CloudflareBypass:
                     status_code,
                 )
 
-            self._refresh_session()
-            retry_response = await self._fetch_main_site(main_site_url)
-            retry_status = retry_response.status_code if retry_response else None
-            if retry_status == 200:
-                return self._store_session_cookies()
+            for attempt in range(_SESSION_RETRIES):
+                # Give a transient block time to clear before asking again
+                delay = exponential_backoff(attempt, base_delay=1.0, max_delay=10.0)
+                await asyncio.sleep(delay + random.uniform(0, 0.5))  # nosec B311
 
-            logger.warning("Retry failed to get session: HTTP %s", retry_status)
+                self._refresh_session()
+                retry_response = await self._fetch_main_site(main_site_url)
+                retry_status = retry_response.status_code if retry_response else None
+                if retry_status == 200:
+                    return self._store_session_cookies()
+
+                logger.warning(
+                    "Retry %d/%d failed to get session: HTTP %s",
+                    attempt + 1,
+                    _SESSION_RETRIES,
+                    retry_status,
+                )
         except Exception as e:
             logger.error("Error getting session cookies: %s", e)
 
@@ -155,9 +176,10 @@ class CloudflareBypass:
         """Prepare WebSocket connection with Cloudflare bypass."""
         # Get session cookies first
         cookies = await self.get_session_cookies(websocket_url)
-
-        # Create cookie header
-        cookie_header = "; ".join([f"{k}={v}" for k, v in cookies.items()])
+        if cookies is self._session_cookies:
+            cookie_header = self._cookie_header
+        else:
+            cookie_header = "; ".join([f"{k}={v}" for k, v in cookies.items()])
 
         return {
             "cookies": cookies,
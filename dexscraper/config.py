@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
+from urllib.parse import urlencode
 
 
 class Chain(Enum):
@@ -73,6 +74,47 @@ class DEX(Enum):
     BASESWAP = "baseswap"
 
 
+# Filters attribute -> WebSocket query key, in the order they appear in the URL
+_FILTER_QUERY_KEYS: tuple[tuple[str, str], ...] = (
+    ("liquidity_min", "filters[liquidity][min]"),
+    ("liquidity_max", "filters[liquidity][max]"),
+    ("volume_h24_min", "filters[volume][h24][min]"),
+    ("volume_h24_max", "filters[volume][h24][max]"),
+    ("volume_h6_min", "filters[volume][h6][min]"),
+    ("volume_h6_max", "filters[volume][h6][max]"),
+    ("volume_h1_min", "filters[volume][h1][min]"),
+    ("volume_h1_max", "filters[volume][h1][max]"),
+    ("txns_h24_min", "filters[txns][h24][min]"),
+    ("txns_h24_max", "filters[txns][h24][max]"),
+    ("txns_h6_min", "filters[txns][h6][min]"),
+    ("txns_h6_max", "filters[txns][h6][max]"),
+    ("txns_h1_min", "filters[txns][h1][min]"),
+    ("txns_h1_max", "filters[txns][h1][max]"),
+    ("pair_age_min", "filters[pairAge][min]"),
+    ("pair_age_max", "filters[pairAge][max]"),
+    ("price_change_h24_min", "filters[priceChange][h24][min]"),
+    ("price_change_h24_max", "filters[priceChange][h24][max]"),
+    ("price_change_h6_min", "filters[priceChange][h6][min]"),
+    ("price_change_h6_max", "filters[priceChange][h6][max]"),
+    ("price_change_h1_min", "filters[priceChange][h1][min]"),
+    ("price_change_h1_max", "filters[priceChange][h1][max]"),
+    ("fdv_min", "filters[fdv][min]"),
+    ("fdv_max", "filters[fdv][max]"),
+    ("market_cap_min", "filters[marketCap][min]"),
+    ("market_cap_max", "filters[marketCap][max]"),
+    ("enhanced_token_info", "filters[enhancedTokenInfo]"),
+    ("active_boosts_min", "filters[activeBoosts][min]"),
+    (
+        "recent_purchased_impressions_min",
+        "filters[recentPurchasedImpressions][min]",
+    ),
+    # Pumpfun specific parameters
+    ("max_age", "maxAge"),
+    ("profile", "profile"),
+    ("max_launchpad_progress", "maxLaunchpadProgress"),
+)
+
+
 @dataclass
 class Filters:
     """Complete filter configuration for DexScreener queries."""
@@ -143,101 +185,12 @@ class Filters:
         for i, dex in enumerate(self.dex_ids):
             params[f"filters[dexIds][{i}]"] = dex.value
 
-        # Liquidity
-        if self.liquidity_min is not None:
-            params["filters[liquidity][min]"] = str(self.liquidity_min)
-        if self.liquidity_max is not None:
-            params["filters[liquidity][max]"] = str(self.liquidity_max)
-
-        # Volume H24
-        if self.volume_h24_min is not None:
-            params["filters[volume][h24][min]"] = str(self.volume_h24_min)
-        if self.volume_h24_max is not None:
-            params["filters[volume][h24][max]"] = str(self.volume_h24_max)
-
-        # Volume H6
-        if self.volume_h6_min is not None:
-            params["filters[volume][h6][min]"] = str(self.volume_h6_min)
-        if self.volume_h6_max is not None:
-            params["filters[volume][h6][max]"] = str(self.volume_h6_max)
-
-        # Volume H1
-        if self.volume_h1_min is not None:
-            params["filters[volume][h1][min]"] = str(self.volume_h1_min)
-        if self.volume_h1_max is not None:
-            params["filters[volume][h1][max]"] = str(self.volume_h1_max)
-
-        # Transactions H24
-        if self.txns_h24_min is not None:
-            params["filters[txns][h24][min]"] = str(self.txns_h24_min)
-        if self.txns_h24_max is not None:
-            params["filters[txns][h24][max]"] = str(self.txns_h24_max)
-
-        # Transactions H6
-        if self.txns_h6_min is not None:
-            params["filters[txns][h6][min]"] = str(self.txns_h6_min)
-        if self.txns_h6_max is not None:
-            params["filters[txns][h6][max]"] = str(self.txns_h6_max)
-
-        # Transactions H1
-        if self.txns_h1_min is not None:
-            params["filters[txns][h1][min]"] = str(self.txns_h1_min)
-        if self.txns_h1_max is not None:
-            params["filters[txns][h1][max]"] = str(self.txns_h1_max)
-
-        # Pair age
-        if self.pair_age_min is not None:
-            params["filters[pairAge][min]"] = str(self.pair_age_min)
-        if self.pair_age_max is not None:
-            params["filters[pairAge][max]"] = str(self.pair_age_max)
-
-        # Price change H24
-        if self.price_change_h24_min is not None:
-            params["filters[priceChange][h24][min]"] = str(self.price_change_h24_min)
-        if self.price_change_h24_max is not None:
-            params["filters[priceChange][h24][max]"] = str(self.price_change_h24_max)
-
-        # Price change H6
-        if self.price_change_h6_min is not None:
-            params["filters[priceChange][h6][min]"] = str(self.price_change_h6_min)
-        if self.price_change_h6_max is not None:
-            params["filters[priceChange][h6][max]"] = str(self.price_change_h6_max)
-
-        # Price change H1
-        if self.price_change_h1_min is not None:
-            params["filters[priceChange][h1][min]"] = str(self.price_change_h1_min)
-        if self.price_change_h1_max is not None:
-            params["filters[priceChange][h1][max]"] = str(self.price_change_h1_max)
-
-        # FDV
-        if self.fdv_min is not None:
-            params["filters[fdv][min]"] = str(self.fdv_min)
-        if self.fdv_max is not None:
-            params["filters[fdv][max]"] = str(self.fdv_max)
-
-        # Market cap
-        if self.market_cap_min is not None:
-            params["filters[marketCap][min]"] = str(self.market_cap_min)
-        if self.market_cap_max is not None:
-            params["filters[marketCap][max]"] = str(self.market_cap_max)
-
-        # Enhanced features
-        if self.enhanced_token_info:
-            params["filters[enhancedTokenInfo]"] = "true"
-        if self.active_boosts_min is not None:
-            params["filters[activeBoosts][min]"] = str(self.active_boosts_min)
-        if self.recent_purchased_impressions_min is not None:
-            params["filters[recentPurchasedImpressions][min]"] = str(
-                self.recent_purchased_impressions_min
-            )
-
-        # Pumpfun specific parameters
-        if self.max_age is not None:
-            params["maxAge"] = str(self.max_age)
-        if self.profile is not None:
-            params["profile"] = str(self.profile)
-        if self.max_launchpad_progress is not None:
-            params["maxLaunchpadProgress"] = str(self.max_launchpad_progress)
+        # Scalar filters, in URL order; unset (None/False) fields are omitted
+        for attr, key in _FILTER_QUERY_KEYS:
+            value = getattr(self, attr)
+            if value is None or value is False:
+                continue
+            params[key] = "true" if value is True else str(value)
 
         return params
 
@@ -273,12 +226,8 @@ class ScrapingConfig:
         # Add filter parameters
         params.update(self.filters.to_query_params())
 
-        # Build query string
-        query_parts = []
-        for key, value in params.items():
-            query_parts.append(f"{key}={value}")
-
-        return f"{base_url}?{'&'.join(query_parts)}"
+        # Percent-encode values; keep the brackets in filter keys readable
+        return f"{base_url}?{urlencode(params, safe='[]')}"
 
 
 # Predefined configurations for common use cases
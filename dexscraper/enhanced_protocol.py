@@ -1,13 +1,29 @@
 """Enhanced binary protocol parser with real numeric data extraction."""
 
 import logging
+import re
 import struct
+import time
+from bisect import bisect_left
 from typing import Optional
 
 from .models import LiquidityData, PriceData, TradingPair, VolumeData
+from .protocol import decode_pair_from_text, find_pairs_tag
+from .utils import unpack_at_offsets
 
 logger = logging.getLogger(__name__)
 
+# Precompiled little-endian layouts for scanning numeric fields in place
+_DOUBLE = struct.Struct("<d")
+_FLOAT = struct.Struct("<f")
+
+# Runs of printable, non-space ASCII; everything else separates words
+_WORD_RE = re.compile(rb"[\x21-\x7e]{2,}")
+
+# Lower-cased chain and protocol names recognised in cluster text
+_CHAIN_NAMES = frozenset(("solana", "ethereum", "base"))
+_PROTOCOL_NAMES = frozenset(("pumpswap", "raydium", "orca", "meteora"))
+
 NumericSeries = list[tuple[int, float]]
 NumericClusterData = dict[str, NumericSeries]
 NumericCluster = tuple[int, NumericClusterData]
@@ -22,7 +38,7 @@ class EnhancedProtocolParser:
     def parse_message(self, data: bytes) -> list[TradingPair]:
         """Parse binary message and extract real trading pair data."""
         try:
-            pairs_pos = data.find(b"pairs")
+            pairs_pos = find_pairs_tag(data)
             if pairs_pos < 0:
                 logger.debug("No 'pairs' section found")
                 return []
@@ -32,19 +48,19 @@ class EnhancedProtocolParser:
             data_section = data[data_start:]
 
             if len(data_section) < 100:
-                logger.debug(f"Data section too small: {len(data_section)} bytes")
+                logger.debug("Data section too small: %d bytes", len(data_section))
                 return []
 
-            logger.debug(f"Parsing {len(data_section)} bytes of trading pair data")
+            logger.debug("Parsing %d bytes of trading pair data", len(data_section))
 
             # Parse trading pairs using our discovered structure
             pairs = self._extract_trading_pairs(data_section)
 
-            logger.debug(f"Extracted {len(pairs)} trading pairs with real data")
+            logger.debug("Extracted %d trading pairs with real data", len(pairs))
             return pairs
 
         except Exception as e:
-            logger.error(f"Error parsing enhanced protocol message: {e}")
+            logger.error("Error parsing enhanced protocol message: %s", e)
             return []
 
     def _extract_trading_pairs(self, data: bytes) -> list[TradingPair]:
@@ -66,7 +82,7 @@ class EnhancedProtocolParser:
                 if pair:
                     pairs.append(pair)
             except Exception as e:
-                logger.debug(f"Error parsing cluster at {cluster_start}: {e}")
+                logger.debug("Error parsing cluster at %d: %s", cluster_start, e)
                 continue
 
         # Fallback to text-based parsing for basic info
@@ -82,10 +98,23 @@ class EnhancedProtocolParser:
         # Scan for areas with high density of reasonable numeric values
         window_size = 128  # Based on our analysis showing 128-byte record candidates
         step = 64  # Overlap windows to catch boundary cases
+        size = len(data)
+        if size <= window_size:
+            return []
 
-        for offset in range(0, len(data) - window_size, step):
-            window = data[offset : offset + window_size]
-            numeric_data = self._extract_numeric_from_window(window)
+        # Decode every candidate offset once; overlapping windows share slices
+        doubles = unpack_at_offsets(_DOUBLE, data, 0, size - 8, 4)
+        floats = unpack_at_offsets(_FLOAT, data, 0, size - 4, 2)
+        doubles_per_window = len(range(0, window_size - 8, 4))
+        floats_per_window = len(range(0, window_size - 4, 2))
+
+        for offset in range(0, size - window_size, step):
+            first_double = offset // 4
+            first_float = offset // 2
+            numeric_data = self._categorize_numerics(
+                doubles[first_double : first_double + doubles_per_window],
+                floats[first_float : first_float + floats_per_window],
+            )
 
             # A valid cluster should have multiple types of data
             if (
@@ -98,62 +127,70 @@ class EnhancedProtocolParser:
         # Remove overlapping clusters, keep the one with most data
         unique_clusters = self._deduplicate_clusters(clusters)
 
-        logger.debug(f"Found {len(unique_clusters)} numeric clusters")
+        logger.debug("Found %d numeric clusters", len(unique_clusters))
         return unique_clusters
 
     def _extract_numeric_from_window(self, window: bytes) -> NumericClusterData:
         """Extract different types of numeric data from a window."""
-        data: NumericClusterData = {
-            "prices": [],  # Small decimals (0.0001-0.001)
-            "volumes": [],  # Medium numbers (1K-10M)
-            "counts": [],  # Small integers (10-50K)
-            "liquidity": [],  # Large numbers (40K-500K)
-            "percentages": [],  # -100 to +500 range
-        }
-
-        # Extract doubles
-        for i in range(0, len(window) - 8, 4):
-            try:
-                val = struct.unpack("<d", window[i : i + 8])[0]
-                if not (0.000001 < abs(val) < 1000000000):
-                    continue
-
-                # Categorize by value range
-                if 0.0001 <= val <= 0.001:
-                    data["prices"].append((i, val))
-                elif 1000 <= val <= 10000000:
-                    data["volumes"].append((i, val))
-                elif 10 <= val <= 50000:
-                    data["counts"].append((i, val))
-                elif 40000 <= val <= 500000:
-                    data["liquidity"].append((i, val))
-                elif -100 <= val <= 500 and abs(val) > 0.01:
-                    data["percentages"].append((i, val))
-
-            except (struct.error, ValueError):
+        size = len(window)
+        return self._categorize_numerics(
+            unpack_at_offsets(_DOUBLE, window, 0, size - 8, 4),
+            unpack_at_offsets(_FLOAT, window, 0, size - 4, 2),
+        )
+
+    @staticmethod
+    def _categorize_numerics(
+        doubles: list[float], floats: list[float]
+    ) -> NumericClusterData:
+        """Sort decoded window values into ranges, keyed by window offset.
+
+        ``doubles`` come from every 4th byte of the window and ``floats`` from
+        every 2nd byte, both starting at the window's first byte.
+        """
+        prices: NumericSeries = []  # Small decimals (0.0001-0.001)
+        volumes: NumericSeries = []  # Medium numbers (1K-10M)
+        counts: NumericSeries = []  # Small integers (10-50K)
+        liquidity: NumericSeries = []  # Large numbers (40K-500K)
+        percentages: NumericSeries = []  # -100 to +500 range
+
+        for i, val in zip(range(0, 4 * len(doubles), 4), doubles):
+            # NaN and ±inf fail both bounds
+            if not (0.000001 < abs(val) < 1000000000):
                 continue
 
-        # Extract floats
-        for i in range(0, len(window) - 4, 2):
-            try:
-                val = struct.unpack("<f", window[i : i + 4])[0]
-                if not (0.000001 < abs(val) < 1000000000):
-                    continue
-
-                # Same categorization for floats
-                if 0.0001 <= val <= 0.001:
-                    data["prices"].append((i, val))
-                elif 1000 <= val <= 10000000:
-                    data["volumes"].append((i, val))
-                elif 40000 <= val <= 500000:
-                    data["liquidity"].append((i, val))
-                elif -100 <= val <= 500 and abs(val) > 0.01:
-                    data["percentages"].append((i, val))
-
-            except (struct.error, ValueError):
+            # Categorize by value range
+            if 0.0001 <= val <= 0.001:
+                prices.append((i, val))
+            elif 1000 <= val <= 10000000:
+                volumes.append((i, val))
+            elif 10 <= val <= 50000:
+                counts.append((i, val))
+            elif 40000 <= val <= 500000:
+                liquidity.append((i, val))
+            elif -100 <= val <= 500 and abs(val) > 0.01:
+                percentages.append((i, val))
+
+        for i, val in zip(range(0, 2 * len(floats), 2), floats):
+            if not (0.000001 < abs(val) < 1000000000):
                 continue
 
-        return data
+            # Same categorization for floats
+            if 0.0001 <= val <= 0.001:
+                prices.append((i, val))
+            elif 1000 <= val <= 10000000:
+                volumes.append((i, val))
+            elif 40000 <= val <= 500000:
+                liquidity.append((i, val))
+            elif -100 <= val <= 500 and abs(val) > 0.01:
+                percentages.append((i, val))
+
+        return {
+            "prices": prices,
+            "volumes": volumes,
+            "counts": counts,
+            "liquidity": liquidity,
+            "percentages": percentages,
+        }
 
     def _deduplicate_clusters(
         self, clusters: list[NumericCluster]
@@ -170,21 +207,23 @@ class EnhancedProtocolParser:
         clusters.sort(key=cluster_score, reverse=True)
 
         unique: list[NumericCluster] = []
-        used_ranges: list[tuple[int, int]] = []
+        # Every cluster spans 128 bytes, so two overlap exactly when their
+        # starts are less than 128 apart; only the nearest kept starts matter
+        used_starts: list[int] = []
 
         for offset, data in clusters:
-            # Check if this overlaps significantly with existing clusters
-            overlaps = False
-            for used_start, used_end in used_ranges:
-                if not (offset + 128 <= used_start or offset >= used_end):
-                    overlaps = True
-                    break
+            index = bisect_left(used_starts, offset)
+            if index < len(used_starts) and used_starts[index] - offset < 128:
+                continue
+            if index and offset - used_starts[index - 1] < 128:
+                continue
 
-            if not overlaps:
-                unique.append((offset, data))
-                used_ranges.append((offset, offset + 128))
+            unique.append((offset, data))
+            if len(unique) == 20:  # Limit to top 20 clusters
+                break
+            used_starts.insert(index, offset)
 
-        return unique[:20]  # Limit to top 20 clusters
+        return unique
 
     def _parse_pair_from_cluster(
         self, full_data: bytes, cluster_start: int, cluster_data: dict
@@ -196,19 +235,20 @@ class EnhancedProtocolParser:
             window_end = min(len(full_data), cluster_start + 300)
             text_window = full_data[window_start:window_end]
 
-            # Get printable text for token names
-            printable = "".join(chr(b) if 32 <= b <= 126 else " " for b in text_window)
-            words = [w.strip() for w in printable.split() if len(w) >= 2]
+            # Printable runs of 2+ characters are candidate token names
+            words = [match.decode("ascii") for match in _WORD_RE.findall(text_window)]
 
             # Extract chain and protocol
             chain = "solana"  # Default
             protocol = "unknown"
 
+            # The last mention in the window wins
             for word in words:
-                if word.lower() in ["solana", "ethereum", "base"]:
-                    chain = word.lower()
-                elif word.lower() in ["pumpswap", "raydium", "orca", "meteora"]:
-                    protocol = word.lower()
+                lowered = word.lower()
+                if lowered in _CHAIN_NAMES:
+                    chain = lowered
+                elif lowered in _PROTOCOL_NAMES:
+                    protocol = lowered
 
             # Extract token symbols and names
             token_symbol = ""  # nosec B105
@@ -246,8 +286,6 @@ class EnhancedProtocolParser:
                 liquidity_data = LiquidityData(usd=liquidity)
 
             # Create timestamp (current time)
-            import time
-
             created_at = int(time.time())
 
             return TradingPair(
@@ -264,23 +302,20 @@ class EnhancedProtocolParser:
             )
 
         except Exception as e:
-            logger.debug(f"Error creating pair from cluster: {e}")
+            logger.debug("Error creating pair from cluster: %s", e)
             return None
 
     def _fallback_text_parsing(self, data: bytes) -> list[TradingPair]:
         """Fallback to text-based parsing when numeric clustering fails."""
         # Use existing text-based approach as fallback
-        from .protocol import decode_pair_from_text
-
         # Split data into chunks and try to parse each
         chunk_size = 512
         pairs = []
 
         for i in range(0, len(data), chunk_size):
             chunk = data[i : i + chunk_size]
-            if b"solana" in chunk or any(
-                proto in chunk for proto in [b"pump", b"raydium"]
-            ):
+            # Each 'in' is a C substring search; chained, they stop at the first hit
+            if b"solana" in chunk or b"pump" in chunk or b"raydium" in chunk:
                 pair = decode_pair_from_text(chunk)
                 if pair:
                     pairs.append(pair)
@@ -1,12 +1,30 @@
 """Data models for DexScreener trading pairs and market data."""
 
+import csv
+import heapq
 import json
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from io import StringIO
+from operator import attrgetter
 from typing import Any, Optional, Union
 
+# Ranking used by ExtractedTokenBatch.get_top_tokens
+_TOP_TOKEN_KEY = attrgetter("confidence_score", "field_count")
+
+
+def _format_local_time(timestamp: float, fmt: str) -> str:
+    """Format a Unix timestamp in local time to second precision."""
+    return _format_local_second(int(timestamp), fmt)
+
+
+@lru_cache(maxsize=256)
+def _format_local_second(seconds: int, fmt: str) -> str:
+    """Memoized per whole second so time.time() placeholders share entries."""
+    return datetime.fromtimestamp(seconds).strftime(fmt)
+
 
 @dataclass
 class PriceData:
@@ -60,21 +78,21 @@ class OHLCData:
 
     def to_mt5_format(self) -> str:
         """Format for MetaTrader 5 import."""
-        dt = datetime.fromtimestamp(self.timestamp)
-        return f"{dt.strftime('%Y.%m.%d %H:%M:%S')},{self.open:.8f},{self.high:.8f},{self.low:.8f},{self.close:.8f},{int(self.volume)}"
+        when = _format_local_time(self.timestamp, "%Y.%m.%d %H:%M:%S")
+        return f"{when},{self.open:.8f},{self.high:.8f},{self.low:.8f},{self.close:.8f},{int(self.volume)}"
 
     def to_csv_format(self) -> str:
         """Format for CSV export (OHLCV)."""
-        dt = datetime.fromtimestamp(self.timestamp)
-        return f"{dt.strftime('%Y-%m-%d %H:%M:%S')},{self.open:.8f},{self.high:.8f},{self.low:.8f},{self.close:.8f},{self.volume:.2f}"
+        when = _format_local_time(self.timestamp, "%Y-%m-%d %H:%M:%S")
+        return f"{when},{self.open:.8f},{self.high:.8f},{self.low:.8f},{self.close:.8f},{self.volume:.2f}"
 
     def to_ohlcvt_format(self) -> str:
         """Format for OHLCVT (Open, High, Low, Close, Volume, Trades) export."""
-        dt = datetime.fromtimestamp(self.timestamp)
+        when = _format_local_time(self.timestamp, "%Y-%m-%d %H:%M:%S")
         trades_count = (
             self.trades if self.trades is not None else int(self.volume / 1000)
         )  # Estimate trades
-        return f"{dt.strftime('%Y-%m-%d %H:%M:%S')},{self.open:.8f},{self.high:.8f},{self.low:.8f},{self.close:.8f},{self.volume:.2f},{trades_count}"
+        return f"{when},{self.open:.8f},{self.high:.8f},{self.low:.8f},{self.close:.8f},{self.volume:.2f},{trades_count}"
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format."""
@@ -376,9 +394,8 @@ class ExtractedTokenBatch:
 
     def get_top_tokens(self, count: int = 10) -> list[TokenProfile]:
         """Get top tokens by confidence and completeness."""
-        return sorted(
-            self.tokens, key=lambda t: (t.confidence_score, t.field_count), reverse=True
-        )[:count]
+        # Partial selection: O(n log count) instead of sorting the whole batch
+        return heapq.nlargest(count, self.tokens, key=_TOP_TOKEN_KEY)
 
     def to_trading_pairs(self) -> list[TradingPair]:
         """Convert all tokens to legacy TradingPair format."""
@@ -473,8 +490,6 @@ class TradingViewExporter:
         Returns:
             TradingView formatted JSON string
         """
-        import json
-
         tv_data = {
             "s": "ok",
             "t": [int(ohlc.timestamp) for ohlc in ohlc_data],
@@ -501,8 +516,6 @@ class BinanceExporter:
         Returns:
             Binance klines formatted JSON string
         """
-        import json
-
         klines = []
         for ohlc in ohlc_data:
             kline = [
@@ -537,8 +550,6 @@ class CoinGeckoExporter:
         Returns:
             CoinGecko formatted JSON string
         """
-        import json
-
         market_data = []
         for i, token in enumerate(tokens):
             if not token.price:
@@ -582,8 +593,6 @@ class PancakeSwapExporter:
         Returns:
             PancakeSwap formatted JSON string
         """
-        import json
-
         pancake_data = {}
         for token in tokens:
             if not token.token_address or not token.price:
@@ -613,8 +622,6 @@ class ExcelExporter:
         Returns:
             Excel-compatible CSV string
         """
-        import csv
-
         output = StringIO()
         writer = csv.writer(output)
 
@@ -690,8 +697,6 @@ class JsonLinesExporter:
         Returns:
             JSON Lines formatted string
         """
-        import json
-
         lines = []
         for ohlc in ohlc_data:
             lines.append(json.dumps(ohlc.to_dict(), separators=(",", ":"), default=str))
@@ -757,5 +762,4 @@ def format_timestamp(timestamp: Optional[int]) -> str:
     if timestamp is None:
         return ""
 
-    dt = datetime.fromtimestamp(timestamp)
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    return _format_local_time(timestamp, "%Y-%m-%d %H:%M:%S")
@@ -1,23 +1,77 @@
 """Binary protocol decoder for DexScreener WebSocket messages."""
 
 import logging
+import math
+import re
 import struct
-from datetime import datetime
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Optional, Union
 
 from .models import LiquidityData, PriceData, TradingPair, VolumeData
+from .utils import printable_text
 
 logger = logging.getLogger(__name__)
 
+# Bytes outside printable ASCII (0x20-0x7E) and TAB, deleted via bytes.translate
+_NON_PRINTABLE_BYTES = bytes(b for b in range(256) if not (32 <= b < 127 or b == 9))
+
+# Eight little-endian doubles trailing each pair record
+_METRICS = struct.Struct("<8d")
+_METRIC_KEYS = (
+    "price",
+    "priceUsd",
+    "priceChangeH24",
+    "liquidityUsd",
+    "volumeH24",
+    "fdv",
+    "timestamp",
+)
+
+# Frame header and section tag; the tag normally sits within the first
+# _PAIRS_TAG_WINDOW bytes, so look there before scanning the whole frame
+_HEADER = b"\x00\n1.3.0\n"
+_HEADER_LEN = len(_HEADER)
+_PAIRS_TAG = b"pairs"
+_PAIRS_TAG_WINDOW = 128
+
+# Length-prefixed string fields at the start of each binary pair record
+_PAIR_FIELDS = (
+    "chain",
+    "protocol",
+    "pairAddress",
+    "baseTokenName",
+    "baseTokenSymbol",
+    "baseTokenAddress",
+)
+
+# Up to ten NUL/newline bytes that may precede a binary pair record
+_LEADING_PADDING = re.compile(rb"[\x00\n]{0,10}")
+
+# Markers that route a record to the text-based decoder
+_TEXT_MARKERS = re.compile(rb"solana|(?i:pump|raydium)")
+
 
 def handle_double(value: float) -> float:
     """Handle potential NaN/Inf values."""
-    try:
-        if not isinstance(value, float) or value != value or abs(value) == float("inf"):
-            return 0.0
-        return value
-    except Exception:
-        return 0.0
+    return value if isinstance(value, float) and math.isfinite(value) else 0.0
+
+
+def _strip_garbage(cleaned: str) -> str:
+    """Drop common garbage suffixes from an already printable string."""
+    # Filter out common garbage patterns
+    if "@" in cleaned or "\\" in cleaned:
+        return cleaned.partition("@")[0].partition("\\")[0]
+
+    return cleaned.strip()
+
+
+def clean_bytes(raw: Union[bytes, memoryview]) -> str:
+    """Decode raw string bytes, keeping only printable ASCII and tabs."""
+    # Only ASCII survives the deletion table, so the strict ASCII codec is safe
+    return _strip_garbage(
+        bytes(raw).translate(None, _NON_PRINTABLE_BYTES).decode("ascii")
+    )
 
 
 def clean_string(s: str) -> str:
@@ -26,146 +80,150 @@ def clean_string(s: str) -> str:
         if not s:
             return ""
         # Remove non-printable characters except spaces and tabs
-        cleaned = "".join(
-            char for char in s if (32 <= ord(char) < 127) or ord(char) == 9
-        )
-
-        # Filter out common garbage patterns
-        if "@" in cleaned or "\\" in cleaned:
-            return cleaned.split("@")[0].split("\\")[0]
-
-        return cleaned.strip()
+        return clean_bytes(s.encode("ascii", errors="ignore"))
     except Exception:
         return ""
 
 
-def decode_metrics(data: bytes, start_pos: int) -> tuple[dict[str, float], int]:
-    """Decode numeric values from binary data."""
+@lru_cache(maxsize=4096)
+def format_created_at(timestamp: int) -> str:
+    """Format a pair creation timestamp as local ``YYYY-MM-DD HH:MM:SS``."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def find_pairs_tag(data: bytes, start: int = 0) -> int:
+    """Return the offset of the ``pairs`` tag in a frame, or -1 if missing."""
+    pos = data.find(_PAIRS_TAG, start, start + _PAIRS_TAG_WINDOW)
+    if pos < 0:
+        pos = data.find(_PAIRS_TAG, start)
+    return pos
+
+
+def decode_metrics(
+    data: Union[bytes, memoryview], start_pos: int, end: Optional[int] = None
+) -> tuple[dict[str, float], int]:
+    """Decode numeric values from binary data, not reading past ``end``."""
     try:
-        if start_pos + 64 > len(data):
+        if start_pos + _METRICS.size > (len(data) if end is None else end):
             return {}, start_pos
 
-        metrics = {}
-        values = struct.unpack("8d", data[start_pos : start_pos + 64])
-
-        # Map metrics with validation
-        value_map = {
-            "price": values[0],
-            "priceUsd": values[1],
-            "priceChangeH24": values[2],
-            "liquidityUsd": values[3],
-            "volumeH24": values[4],
-            "fdv": values[5],
-            "timestamp": values[6],
-        }
-
-        # Validate and clean each value
-        for key, value in value_map.items():
-            cleaned = handle_double(value)
+        metrics: dict[str, float] = {}
+        clean = handle_double
+
+        # Map metrics with validation; the eighth double is unused
+        for key, value in zip(_METRIC_KEYS, _METRICS.unpack_from(data, start_pos)):
+            cleaned = clean(value)
             if cleaned != 0:
                 metrics[key] = cleaned
 
-        return metrics, start_pos + 64
+        return metrics, start_pos + _METRICS.size
 
     except Exception as e:
-        logger.debug(f"Error decoding metrics: {e}")
+        logger.debug("Error decoding metrics: %s", e)
         return {}, start_pos
 
 
 def decode_pair(data: bytes) -> Optional[TradingPair]:
     """Decode a single trading pair from binary data."""
+    return decode_pair_data(data)[0]
+
+
+def decode_pair_data(
+    data: Union[bytes, memoryview], pos: int = 0, end: Optional[int] = None
+) -> tuple[Optional[TradingPair], int]:
+    """Decode a trading pair from ``data[pos:end]`` without copying the record.
+
+    ``data`` may be a memoryview; only the string fields are materialized.
+
+    Returns the decoded pair (or None) and the offset where the next record
+    should be tried: just past the metrics block when one was read, otherwise
+    ``end``.
+    """
+    if end is None:
+        end = len(data)
+    start = pos
     try:
         # First try the original binary parsing approach
-        pos = 0
-        pair_data = {}
-
         # Skip initial null bytes but be more flexible
-        while pos < len(data) and pos < 10 and data[pos] in (0x00, 0x0A):
-            pos += 1
+        padding = _LEADING_PADDING.match(data, pos, end)
+        if padding:
+            pos = padding.end()
 
         # Look for recognizable patterns in the binary data
-        # Check if this chunk contains printable text that looks like token data
-        printable = "".join(chr(b) if 32 <= b <= 126 else " " for b in data)
-        if "solana" in printable or any(
-            proto in printable.lower() for proto in ["pump", "raydium"]
-        ):
+        # Check if this record contains text that looks like token data
+        if _TEXT_MARKERS.search(data, start, end):
             # This looks like it contains text data, try text-based parsing
-            return decode_pair_from_text(data)
-
-        # Try binary field parsing with better error handling
-        fields = [
-            "chain",
-            "protocol",
-            "pairAddress",
-            "baseTokenName",
-            "baseTokenSymbol",
-            "baseTokenAddress",
-        ]
-
-        for field_idx, field in enumerate(fields):
-            if pos >= len(data):
+            return decode_pair_from_text(bytes(data[start:end])), end
+
+        # Walk the length-prefixed fields first, recording where each one lives
+        spans: list[tuple[str, int, int]] = []
+        for field in _PAIR_FIELDS:
+            if pos >= end:
                 break
 
             str_len = data[pos]
             pos += 1
+            field_end = pos + str_len
 
             # More flexible length validation
-            if str_len > min(200, len(data) - pos):
+            if str_len > 200 or field_end > end:
                 logger.debug(
-                    f"Suspicious length {str_len} for field {field} at pos {pos}"
+                    "Suspicious length %d for field %s at pos %d", str_len, field, pos
                 )
                 # Try to find next reasonable field start
                 break
 
-            if str_len == 0:
-                continue
-
-            if pos + str_len <= len(data):
-                try:
-                    value = clean_string(
-                        data[pos : pos + str_len].decode("utf-8", errors="ignore")
-                    )
-                    if value and len(value) >= 2:  # Only accept reasonable values
-                        pair_data[field] = value
-                except Exception:  # nosec B110
-                    pass
-            pos += str_len
+            if str_len:
+                spans.append((field, pos, str_len))
+            pos = field_end
 
         # Align to 8-byte boundary for doubles
-        pos = (pos + 7) & ~7
-
-        # Read and format metrics
-        metrics, pos = decode_metrics(data, pos)
-
-        if not metrics or len(pair_data) < 3:
-            return None
+        pos = start + ((pos - start + 7) & ~7)
+
+        # Read the metrics block straight into locals; 0.0 marks a missing value
+        next_pos = pos + _METRICS.size
+        if next_pos > min(end, len(data)):
+            return None, end
+        (
+            price,
+            price_usd,
+            price_change,
+            liquidity_usd,
+            volume_h24,
+            fdv,
+            timestamp,
+            _,
+        ) = map(handle_double, _METRICS.unpack_from(data, pos))
+
+        metrics = (price, price_usd, price_change, liquidity_usd, volume_h24, fdv)
+        if len(spans) < 3 or not (any(metrics) or timestamp):
+            return None, next_pos
+
+        # Decode the strings in one pass, keeping only reasonable values
+        values = (
+            (field, clean_bytes(data[offset : offset + length]))
+            for field, offset, length in spans
+        )
+        pair_data = {field: value for field, value in values if len(value) >= 2}
+        if len(pair_data) < 3:
+            return None, next_pos
 
         # Create data objects
-        price_data = None
-        if "price" in metrics and "priceUsd" in metrics:
-            price_data = PriceData(
-                current=metrics["price"],
-                usd=metrics["priceUsd"],
-                change_24h=metrics.get("priceChangeH24"),
-            )
-
-        liquidity_data = None
-        if "liquidityUsd" in metrics:
-            liquidity_data = LiquidityData(usd=metrics["liquidityUsd"])
-
-        volume_data = None
-        if "volumeH24" in metrics:
-            volume_data = VolumeData(h24=metrics["volumeH24"])
+        price_data = (
+            PriceData(current=price, usd=price_usd, change_24h=price_change or None)
+            if price and price_usd
+            else None
+        )
+        liquidity_data = LiquidityData(usd=liquidity_usd) if liquidity_usd else None
+        volume_data = VolumeData(h24=volume_h24) if volume_h24 else None
 
         # Handle timestamp
         created_at = None
         created_at_formatted = None
-        if "timestamp" in metrics and 0 <= metrics["timestamp"] < 4102444800:
-            created_at = int(metrics["timestamp"])
+        if 0 < timestamp < 4102444800:
+            created_at = int(timestamp)
             try:
-                created_at_formatted = datetime.fromtimestamp(created_at).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
+                created_at_formatted = format_created_at(created_at)
             except Exception:
                 created_at_formatted = "1970-01-01 00:00:00"
 
@@ -180,7 +238,7 @@ def decode_pair(data: bytes) -> Optional[TradingPair]:
             price_data=price_data,
             liquidity_data=liquidity_data,
             volume_data=volume_data,
-            fdv=metrics.get("fdv"),
+            fdv=fdv or None,
             created_at=created_at,
             created_at_formatted=created_at_formatted,
         )
@@ -191,20 +249,20 @@ def decode_pair(data: bytes) -> Optional[TradingPair]:
             or (volume_data and volume_data.h24 != 0)
             or (liquidity_data and liquidity_data.usd != 0)
         ):
-            return trading_pair
+            return trading_pair, next_pos
 
-        return None
+        return None, next_pos
 
     except Exception as e:
-        logger.debug(f"Error decoding pair: {e}")
-        return None
+        logger.debug("Error decoding pair: %s", e)
+        return None, end
 
 
 def decode_pair_from_text(data: bytes) -> Optional[TradingPair]:
     """Decode a trading pair using text-based extraction similar to MostafaRoohy's approach."""
     try:
         # Extract printable text
-        printable = "".join(chr(b) if 32 <= b <= 126 else " " for b in data)
+        printable = printable_text(data)
         words = [word.strip() for word in printable.split() if len(word.strip()) >= 2]
 
         if len(words) < 3:
@@ -277,7 +335,7 @@ def decode_pair_from_text(data: bytes) -> Optional[TradingPair]:
         return None
 
     except Exception as e:
-        logger.debug(f"Error in text-based pair decoding: {e}")
+        logger.debug("Error in text-based pair decoding: %s", e)
         return None
 
 
@@ -287,13 +345,13 @@ def parse_variable_length(data: bytes) -> list[TradingPair]:
 
     try:
         # Extract printable text to find tokens and addresses
-        printable = "".join(chr(b) if 32 <= b <= 126 else " " for b in data)
+        printable = printable_text(data)
 
         # Split into potential records - look for common patterns
         # Based on analysis, "solana" appears to be a common separator/marker
         sections = printable.split("solana")
 
-        logger.debug(f"Found {len(sections)} potential sections split by 'solana'")
+        logger.debug("Found %d potential sections split by 'solana'", len(sections))
 
         for i, section in enumerate(sections[1:], 1):  # Skip first empty section
             if len(section.strip()) < 10:  # Skip very short sections
@@ -353,9 +411,9 @@ def parse_variable_length(data: bytes) -> list[TradingPair]:
                     break
 
     except Exception as e:
-        logger.debug(f"Error in variable-length parsing: {e}")
+        logger.debug("Error in variable-length parsing: %s", e)
 
-    logger.debug(f"Variable-length parser extracted {len(pairs)} pairs")
+    logger.debug("Variable-length parser extracted %d pairs", len(pairs))
     return pairs
 
 
@@ -369,19 +427,19 @@ def parse_message(message: bytes) -> list[TradingPair]:
             pairs = parse_message_enhanced(message)
             if pairs:
                 logger.debug(
-                    f"Enhanced parser extracted {len(pairs)} pairs with real data"
+                    "Enhanced parser extracted %d pairs with real data", len(pairs)
                 )
                 return pairs
         except ImportError:
             logger.debug("Enhanced parser not available, using fallback")
         except Exception as e:
-            logger.debug(f"Enhanced parser failed: {e}, falling back to basic parsing")
+            logger.debug("Enhanced parser failed: %s, falling back to basic parsing", e)
 
         # Original parsing logic as fallback
-        if not message.startswith(b"\x00\n1.3.0\n"):
+        if message[:_HEADER_LEN] != _HEADER:
             return []
 
-        pairs_start = message.find(b"pairs")
+        pairs_start = find_pairs_tag(message, _HEADER_LEN)
         if pairs_start == -1:
             return []
 
@@ -390,27 +448,37 @@ def parse_message(message: bytes) -> list[TradingPair]:
         pos = pairs_start + 9
 
         logger.debug(
-            f"Starting pair parsing at position {pos}, message length: {len(message)}"
+            "Starting pair parsing at position %d, message length: %d",
+            pos,
+            len(message),
         )
 
         # Try different chunk sizes based on analysis
         chunk_sizes = [512, 256, 128]  # Try different sizes
 
+        # One zero-copy view shared by every decode attempt below
+        view = memoryview(message)
+        decode = decode_pair_data
+
         for chunk_size in chunk_sizes:
-            pairs_attempt = []
+            pairs_attempt: list[TradingPair] = []
+            append = pairs_attempt.append
             pos_attempt = pos
+            stop = len(message) - chunk_size
 
-            while pos_attempt < len(message) - chunk_size:
-                pair = decode_pair(message[pos_attempt : pos_attempt + chunk_size])
+            while pos_attempt < stop:
+                # Advance by the bytes the record actually used, not the window
+                pair, pos_attempt = decode(view, pos_attempt, pos_attempt + chunk_size)
                 if pair:
-                    pairs_attempt.append(pair)
-                pos_attempt += chunk_size
+                    append(pair)
 
                 # Stop if we get too many empty results
                 if len(pairs_attempt) == 0 and pos_attempt > pos + (chunk_size * 10):
                     break
 
-            logger.debug(f"Chunk size {chunk_size}: found {len(pairs_attempt)} pairs")
+            logger.debug(
+                "Chunk size %d: found %d pairs", chunk_size, len(pairs_attempt)
+            )
 
             # Use the chunk size that gives us the most valid pairs
             if len(pairs_attempt) > len(pairs):
@@ -424,5 +492,5 @@ def parse_message(message: bytes) -> list[TradingPair]:
         return pairs
 
     except Exception as e:
-        logger.debug(f"Error parsing message: {e}")
+        logger.debug("Error parsing message: %s", e)
         return []
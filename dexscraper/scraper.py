@@ -2,15 +2,13 @@
 
 import asyncio
 import inspect
-import json
 import logging
 import os
-import random
 import re
 import ssl
 import struct
 import time
-from typing import Any, Callable, Optional, Union
+from typing import Any, AsyncGenerator, Callable, Optional, Union
 
 import websockets
 
@@ -22,11 +20,26 @@ except Exception:  # pragma: no cover - fallback for older websockets layouts
 from .cloudflare_bypass import CloudflareBypass
 from .config import PresetConfigs, ScrapingConfig
 from .models import ExtractedTokenBatch, TokenProfile, TradingPair
+from .utils import (
+    exponential_backoff,
+    printable_text,
+    unpack_at_offsets,
+    write_json_line,
+    write_lines,
+)
 
 logger = logging.getLogger(__name__)
 _BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 _BASE58_ALPHABET_SET = set(_BASE58_ALPHABET)
 
+# Precompiled little-endian layouts for scanning numeric fields in place
+_DOUBLE = struct.Struct("<d")
+_FLOAT = struct.Struct("<f")
+_UINT32 = struct.Struct("<I")
+
+# Text control frames the server may interleave with data, mapped to replies
+_CONTROL_REPLIES = {"ping": "pong"}
+
 _CONNECT_SIGNATURE = inspect.signature(websockets.connect)
 _CONNECT_SUPPORTS_PROXY = "proxy" in _CONNECT_SIGNATURE.parameters
 _CONNECT_HEADERS_PARAM = (
@@ -34,6 +47,12 @@ _CONNECT_HEADERS_PARAM = (
     if "additional_headers" in _CONNECT_SIGNATURE.parameters
     else "extra_headers"
 )
+# Handshake headers websockets writes itself; passing them again duplicates them
+_HANDSHAKE_MANAGED_HEADERS = (
+    "Origin",
+    "Sec-WebSocket-Version",
+    "Sec-WebSocket-Extensions",
+)
 
 
 class DexScraper:
@@ -47,6 +66,7 @@ class DexScraper:
         backoff_base: float = 1.0,
         use_cloudflare_bypass: bool = False,
         config: Optional[ScrapingConfig] = None,
+        websocket_compression: bool = False,
     ) -> None:
         """Initialize the enhanced scraper.
 
@@ -57,6 +77,7 @@ class DexScraper:
             backoff_base: Base seconds for exponential backoff
             use_cloudflare_bypass: Use cloudscraper to bypass Cloudflare
             config: Scraping configuration (defaults to trending Solana)
+            websocket_compression: Negotiate permessage-deflate on the socket
         """
         self.debug = debug
         self.rate_limit = rate_limit
@@ -64,6 +85,7 @@ class DexScraper:
         self.backoff_base = backoff_base
         self.use_cloudflare_bypass = use_cloudflare_bypass
         self.config = config or PresetConfigs.trending()
+        self.websocket_compression = websocket_compression
 
         # Setup logging
         level = logging.DEBUG if debug else logging.ERROR
@@ -72,12 +94,14 @@ class DexScraper:
         )
 
         # Rate limiting
-        self._last_request = 0.0
+        self._last_request = float("-inf")
         self._min_interval = 1.0 / rate_limit
 
         # Connection state
         self._retry_count = 0
         self._headers_rotation = 0
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._pairs_offset: Optional[int] = None
 
         # Cloudflare bypass
         self.cf_bypass = (
@@ -146,18 +170,21 @@ class DexScraper:
 
     async def _rate_limit(self) -> None:
         """Implement rate limiting."""
-        now = time.time()
+        # Monotonic so wall-clock adjustments can't stall or skip the limit
+        now = time.monotonic()
         time_since_last = now - self._last_request
         if time_since_last < self._min_interval:
             await asyncio.sleep(self._min_interval - time_since_last)
-        self._last_request = time.time()
+        self._last_request = time.monotonic()
 
     def _get_backoff_delay(self) -> float:
         """Calculate exponential backoff delay with jitter."""
-        delay = self.backoff_base * (2 ** min(self._retry_count, 8))
-        # Add jitter (±25%)
-        jitter = delay * 0.25 * (2 * random.random() - 1)  # nosec B311
-        return float(delay + jitter)
+        return exponential_backoff(
+            min(self._retry_count, 8),
+            base_delay=self.backoff_base,
+            max_delay=self.backoff_base * 2**8,
+            jitter=0.25,
+        )
 
     def _resolve_proxy_override(self) -> Optional[Union[str, bool]]:
         """Resolve optional proxy override from DEXSCRAPER_PROXY environment variable."""
@@ -174,14 +201,21 @@ class DexScraper:
 
         return value
 
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        """Return the TLS context, loading the CA bundle only once."""
+        if self._ssl_context is None:
+            ssl_context = ssl.create_default_context()
+            # Add ALPN support to match curl behavior - this bypasses Cloudflare detection
+            ssl_context.set_alpn_protocols(["http/1.1"])
+            self._ssl_context = ssl_context
+        return self._ssl_context
+
     async def _connect(self) -> Optional[WebSocketConnection]:
         """Establish WebSocket connection with retry logic."""
         uri = self.config.build_websocket_url()
         logger.debug(f"Connecting to: {uri}")
 
-        ssl_context = ssl.create_default_context()
-        # Add ALPN support to match curl behavior - this bypasses Cloudflare detection
-        ssl_context.set_alpn_protocols(["http/1.1"])
+        ssl_context = self._get_ssl_context()
 
         for attempt in range(self.max_retries):
             try:
@@ -201,15 +235,21 @@ class DexScraper:
 
                 logger.debug(f"Connection attempt {attempt + 1}/{self.max_retries}")
 
-                # Keep Origin set via dedicated websocket arg to avoid duplicates.
+                # Keep Origin set via dedicated websocket arg to avoid duplicates,
+                # and leave version/extension negotiation to websockets.
                 connect_headers = headers.copy()
-                connect_headers.pop("Origin", None)
+                for name in _HANDSHAKE_MANAGED_HEADERS:
+                    connect_headers.pop(name, None)
 
                 connect_kwargs: dict[str, Any] = {
                     _CONNECT_HEADERS_PARAM: connect_headers,
                     "origin": "https://dexscreener.com",
                     "ssl": ssl_context,
                     "max_size": None,
+                    # Read frame by frame; a slow consumer pushes back on the server
+                    "max_queue": 2,
+                    # Frames are compact binary; skip per-message inflate by default
+                    "compression": "deflate" if self.websocket_compression else None,
                     "ping_timeout": 30,
                     "ping_interval": 20,
                     "close_timeout": 10,
@@ -260,34 +300,139 @@ class DexScraper:
             logger.debug(f"Handshake: {len(handshake)} bytes")
 
             # Get pairs data message
-            pairs_message = await websocket.recv()
-            logger.debug(f"Pairs message: {len(pairs_message)} bytes")
+            pairs_message = await self._recv_data(websocket)
+            return await self._parse_pairs_message(pairs_message)
 
-            # Navigate to data section using validated approach
-            pairs_pos = pairs_message.find(b"pairs")
-            if pairs_pos < 0:
-                logger.error("No 'pairs' section found in message")
-                return ExtractedTokenBatch()
+        except Exception as e:
+            logger.error(f"Error during extraction: {e}")
+            return ExtractedTokenBatch()
+        finally:
+            await websocket.close()
 
-            data_start = pairs_pos + 20  # Validated offset
-            data_section = pairs_message[data_start:]
+    async def stream_token_batches(
+        self, interval: float = 0.0, idle_timeout: float = 60.0
+    ) -> AsyncGenerator[ExtractedTokenBatch, None]:
+        """Yield a token batch for data frames pushed on one connection.
 
-            logger.debug(
-                f"Analyzing {len(data_section)} bytes of binary trading data..."
-            )
+        With an interval, at most one frame per interval is parsed: frames
+        pushed before the deadline are dropped unparsed except the newest.
+        If nothing is pushed for a whole interval the generator returns so
+        the caller can reconnect for a fresh snapshot.
 
-            # Extract tokens using comprehensive methodology
-            tokens = await self._extract_all_tokens(data_section, data_start)
+        Args:
+            interval: Minimum seconds between parsed frames; 0 parses every frame
+            idle_timeout: Seconds to wait for a data frame before giving up
 
-            logger.info(f"Successfully extracted {len(tokens)} complete token profiles")
-            return ExtractedTokenBatch(tokens=tokens)
+        Raises:
+            ConnectionError: If the connection fails or the feed goes idle.
+        """
+        websocket = await self._connect()
+        if not websocket:
+            raise ConnectionError("Failed to establish WebSocket connection")
 
-        except Exception as e:
-            logger.error(f"Error during extraction: {e}")
-            return ExtractedTokenBatch()
+        try:
+            handshake = await websocket.recv()
+            logger.debug("Handshake: %d bytes", len(handshake))
+
+            deadline = time.monotonic()
+            pairs_message = await self._recv_data_within(websocket, idle_timeout)
+            while True:
+                emitted = False
+                try:
+                    batch = await self._parse_pairs_message(pairs_message)
+                except Exception as e:
+                    # One malformed frame shouldn't cost the connection
+                    logger.error("Error during extraction: %s", e)
+                else:
+                    yield batch
+                    emitted = bool(batch.tokens)
+
+                if interval <= 0 or not emitted:
+                    pairs_message = await self._recv_data_within(
+                        websocket, idle_timeout
+                    )
+                    continue
+
+                now = time.monotonic()
+                deadline += interval
+                if deadline <= now:
+                    deadline = now + interval
+
+                latest: Optional[bytes] = None
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        latest = await asyncio.wait_for(
+                            self._recv_data(websocket), remaining
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                if latest is None:
+                    logger.debug("No frame pushed for %.1f seconds", interval)
+                    return
+                pairs_message = latest
         finally:
             await websocket.close()
 
+    async def _recv_data_within(
+        self, websocket: WebSocketConnection, idle_timeout: float
+    ) -> bytes:
+        """Receive the next data frame or fail if the feed stays idle."""
+        try:
+            return await asyncio.wait_for(self._recv_data(websocket), idle_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError(
+                f"No data received for {idle_timeout:.0f} seconds"
+            ) from None
+
+    async def _parse_pairs_message(self, pairs_message: bytes) -> ExtractedTokenBatch:
+        """Extract token profiles from one pairs data frame."""
+        logger.debug(f"Pairs message: {len(pairs_message)} bytes")
+
+        # Navigate to data section using validated approach
+        pairs_pos = self._find_pairs_section(pairs_message)
+        if pairs_pos < 0:
+            logger.error("No 'pairs' section found in message")
+            return ExtractedTokenBatch()
+
+        data_start = pairs_pos + 20  # Validated offset
+        # View the payload rather than copying the whole frame
+        data_section = memoryview(pairs_message)[data_start:]
+
+        logger.debug(f"Analyzing {len(data_section)} bytes of binary trading data...")
+
+        # Extract tokens using comprehensive methodology
+        tokens = await self._extract_all_tokens(data_section, data_start)
+
+        logger.info(f"Successfully extracted {len(tokens)} complete token profiles")
+        return ExtractedTokenBatch(tokens=tokens)
+
+    def _find_pairs_section(self, message: bytes) -> int:
+        """Locate the 'pairs' tag, reusing the offset seen in the previous frame."""
+        cached = self._pairs_offset
+        # Only the short header up to the cached offset needs scanning
+        if cached is not None and message.find(b"pairs", 0, cached + 5) == cached:
+            return cached
+
+        pairs_pos = message.find(b"pairs")
+        self._pairs_offset = pairs_pos if pairs_pos >= 0 else None
+        return pairs_pos
+
+    async def _recv_data(self, websocket: WebSocketConnection) -> bytes:
+        """Receive the next data frame, answering any text control frames first."""
+        while True:
+            message = await websocket.recv()
+            if isinstance(message, bytes):
+                return message
+
+            reply = _CONTROL_REPLIES.get(message)
+            if reply is None:
+                return message.encode("utf-8")
+            await websocket.send(reply)
+
     def extract_token_data_sync(self) -> ExtractedTokenBatch:
         """Synchronously extract a single token batch.
 
@@ -305,7 +450,7 @@ class DexScraper:
         )
 
     async def _extract_all_tokens(
-        self, data: bytes, data_start: int
+        self, data: Union[bytes, memoryview], data_start: int
     ) -> list[TokenProfile]:
         """Extract tokens using proven deep analysis methodology from ANALYSIS.md."""
         logger.debug(
@@ -313,23 +458,25 @@ class DexScraper:
         )
 
         # Convert to printable text for symbol extraction
-        printable = "".join(chr(b) if 32 <= b <= 126 else " " for b in data)
+        printable = printable_text(data)
 
         # Extract token names using proven patterns (from deep analyzer)
         token_names = self._extract_real_token_names(printable, data_start)
         logger.debug(f"Found {len(token_names)} potential token symbols")
-        metadata = self._extract_metadata_patterns(data, data_start)
+        metadata = self._extract_metadata_patterns(data, data_start, printable)
 
         # Extract complete token records around each symbol
         tokens = []
         positions = sorted(token_names.keys())
+        # Record windows overlap heavily; view them instead of copying ~1KB each
+        view = memoryview(data)
 
         for pos in positions:
             token_name = token_names[pos]
             # Extract record data around this token (±500 bytes as per ANALYSIS.md)
             record_start = max(0, pos - data_start - 500)
             record_end = min(len(data), pos - data_start + 500)
-            record_data = data[record_start:record_end]
+            record_data = view[record_start:record_end]
 
             # Extract numeric fields using validated IEEE 754 structure
             token_record = self._extract_validated_token_record(
@@ -585,72 +732,58 @@ class DexScraper:
         return token_names
 
     def _extract_validated_token_record(
-        self, token_name: str, record_data: bytes, position: int
+        self, token_name: str, record_data: Union[bytes, memoryview], position: int
     ) -> Optional[TokenProfile]:
         """Extract complete token record using exact logic from working deep analyzer."""
         fields = {}
 
         # Use exact logic from analyze_protocol_deep.py that WORKS
-        for offset in range(len(record_data) - 8):
-            try:
-                # Extract double (primary format per ANALYSIS.md)
-                val = struct.unpack("<d", record_data[offset : offset + 8])[0]
-
-                # Use exact classification from working deep analyzer
-                if 0.000001 <= val <= 0.1:  # Price range
-                    if "price" not in fields:
-                        fields["price"] = val
-                elif 1000 <= val <= 10000000:  # Volume/liquidity/mcap
-                    if val >= 1000000 and "market_cap" not in fields:
-                        fields["market_cap"] = val
-                    elif val >= 100000 and "volume_24h" not in fields:
-                        fields["volume_24h"] = val
-                    elif "liquidity" not in fields:
-                        fields["liquidity"] = val
-                elif 10 <= val <= 50000:  # Txns/makers - use deep analyzer logic
-                    if val >= 1000 and "txns_24h" not in fields:
-                        fields["txns_24h"] = int(val)
-                    elif "makers" not in fields:
-                        fields["makers"] = int(val)
-            except Exception:  # nosec B112
-                continue
+        # Extract doubles (primary format per ANALYSIS.md) at every byte offset
+        size = len(record_data)
+        for val in unpack_at_offsets(_DOUBLE, record_data, 0, size - 8):
+            # Use exact classification from working deep analyzer
+            if 0.000001 <= val <= 0.1:  # Price range
+                if "price" not in fields:
+                    fields["price"] = val
+            elif 1000 <= val <= 10000000:  # Volume/liquidity/mcap
+                if val >= 1000000 and "market_cap" not in fields:
+                    fields["market_cap"] = val
+                elif val >= 100000 and "volume_24h" not in fields:
+                    fields["volume_24h"] = val
+                elif "liquidity" not in fields:
+                    fields["liquidity"] = val
+            elif 10 <= val <= 50000:  # Txns/makers - use deep analyzer logic
+                if val >= 1000 and "txns_24h" not in fields:
+                    fields["txns_24h"] = int(val)
+                elif "makers" not in fields:
+                    fields["makers"] = int(val)
 
         # Also try float extraction (as deep analyzer does)
-        for offset in range(len(record_data) - 4):
-            try:
-                val = struct.unpack("<f", record_data[offset : offset + 4])[0]
-
-                if 0.000001 <= val <= 0.1:  # Price range
-                    if "price" not in fields:
-                        fields["price"] = val
-                elif 1000 <= val <= 10000000:  # Volume/liquidity/mcap
-                    if val >= 1000000 and "market_cap" not in fields:
-                        fields["market_cap"] = val
-                    elif val >= 100000 and "volume_24h" not in fields:
-                        fields["volume_24h"] = val
-                    elif "liquidity" not in fields:
-                        fields["liquidity"] = val
-                elif 10 <= val <= 50000:  # Txns/makers
-                    if val >= 1000 and "txns_24h" not in fields:
-                        fields["txns_24h"] = int(val)
-                    elif "makers" not in fields:
-                        fields["makers"] = int(val)
-            except Exception:  # nosec B112
-                continue
+        for val in unpack_at_offsets(_FLOAT, record_data, 0, size - 4):
+            if 0.000001 <= val <= 0.1:  # Price range
+                if "price" not in fields:
+                    fields["price"] = val
+            elif 1000 <= val <= 10000000:  # Volume/liquidity/mcap
+                if val >= 1000000 and "market_cap" not in fields:
+                    fields["market_cap"] = val
+                elif val >= 100000 and "volume_24h" not in fields:
+                    fields["volume_24h"] = val
+                elif "liquidity" not in fields:
+                    fields["liquidity"] = val
+            elif 10 <= val <= 50000:  # Txns/makers
+                if val >= 1000 and "txns_24h" not in fields:
+                    fields["txns_24h"] = int(val)
+                elif "makers" not in fields:
+                    fields["makers"] = int(val)
 
         # CRITICAL: Also extract uint32 integers for transaction counts (as deep analyzer finds)
-        for offset in range(len(record_data) - 4):
-            try:
-                val = struct.unpack("<I", record_data[offset : offset + 4])[0]
-
-                # Transaction counts: 1000 to 50000 range (based on deep analyzer findings)
-                if 1000 <= val <= 50000 and "txns_24h" not in fields:
-                    fields["txns_24h"] = val
-                # Maker counts: 10 to 1000 range
-                elif 10 <= val <= 1000 and "makers" not in fields:
-                    fields["makers"] = val
-            except Exception:  # nosec B112
-                continue
+        for val in unpack_at_offsets(_UINT32, record_data, 0, size - 4):
+            # Transaction counts: 1000 to 50000 range (based on deep analyzer findings)
+            if 1000 <= val <= 50000 and "txns_24h" not in fields:
+                fields["txns_24h"] = val
+            # Maker counts: 10 to 1000 range
+            elif 10 <= val <= 1000 and "makers" not in fields:
+                fields["makers"] = val
 
         # Return token with at least 3 fields (as deep analyzer does)
         if len(fields) >= 3:
@@ -679,8 +812,9 @@ class DexScraper:
         window_size = 500  # Validated window size
         step_size = 200  # Overlapping windows for complete coverage
 
+        view = memoryview(data)
         for offset in range(0, len(data) - window_size, step_size):
-            window = data[offset : offset + window_size]
+            window = view[offset : offset + window_size]
             numeric_values = self._extract_numerics_from_window(
                 window, data_start + offset
             )
@@ -705,49 +839,52 @@ class DexScraper:
         return clusters
 
     def _extract_numerics_from_window(
-        self, window: bytes, base_offset: int
+        self, window: Union[bytes, memoryview], base_offset: int
     ) -> list[tuple]:
         """Extract all numeric values from window with validation."""
-        values = []
+        size = len(window)
+        is_valid = self._is_valid_numeric_value
 
         # Extract doubles (8-byte IEEE 754)
-        for i in range(0, len(window) - 8, 4):
-            try:
-                val = struct.unpack("<d", window[i : i + 8])[0]
-                if self._is_valid_numeric_value(val):
-                    values.append((base_offset + i, val, "double"))
-            except Exception:  # nosec B112
-                continue
+        double_offsets = range(0, size - 8, 4)
+        values = [
+            (base_offset + i, val, "double")
+            for i, val in zip(
+                double_offsets, unpack_at_offsets(_DOUBLE, window, 0, size - 8, 4)
+            )
+            if is_valid(val)
+        ]
 
-        # Extract floats (4-byte IEEE 754)
-        for i in range(0, len(window) - 4, 2):
-            # Skip positions covered by doubles
-            if any(abs((base_offset + i) - pos) < 4 for pos, _, _ in values):
-                continue
+        # Positions within 3 bytes of an accepted value are already covered
+        covered: set[int] = set()
+        for pos, _, _ in values:
+            covered.update(range(pos - 3, pos + 4))
 
-            try:
-                val = struct.unpack("<f", window[i : i + 4])[0]
-                if self._is_valid_numeric_value(val):
-                    values.append((base_offset + i, val, "float"))
-            except Exception:  # nosec B112
+        # Extract floats (4-byte IEEE 754)
+        float_offsets = range(0, size - 4, 2)
+        for i, val in zip(
+            float_offsets, unpack_at_offsets(_FLOAT, window, 0, size - 4, 2)
+        ):
+            # Skip positions covered by doubles or earlier floats
+            pos = base_offset + i
+            if pos in covered or not is_valid(val):
                 continue
+            values.append((pos, val, "float"))
+            covered.update(range(pos - 3, pos + 4))
 
         # Extract 32-bit integers (counts)
-        for i in range(0, len(window) - 4, 4):
+        low = self.value_ranges["txns"][0]
+        high = self.value_ranges["makers"][1]
+        int_offsets = range(0, size - 4, 4)
+        for i, val in zip(
+            int_offsets, unpack_at_offsets(_UINT32, window, 0, size - 4, 4)
+        ):
             # Skip positions covered by other types
-            if any(abs((base_offset + i) - pos) < 4 for pos, _, _ in values):
-                continue
-
-            try:
-                val = struct.unpack("<I", window[i : i + 4])[0]
-                if (
-                    self.value_ranges["txns"][0]
-                    <= val
-                    <= self.value_ranges["makers"][1]
-                ):
-                    values.append((base_offset + i, float(val), "uint32"))
-            except Exception:  # nosec B112
+            pos = base_offset + i
+            if pos in covered or not low <= val <= high:
                 continue
+            values.append((pos, float(val), "uint32"))
+            covered.update(range(pos - 3, pos + 4))
 
         # Sort by position and remove overlaps
         values.sort(key=lambda x: x[0])
@@ -755,13 +892,8 @@ class DexScraper:
 
     def _is_valid_numeric_value(self, val: float) -> bool:
         """Validate numeric value using established ranges."""
-        return (
-            not (val != val)
-            and val != float("inf")  # Not NaN
-            and val != float("-inf")  # Not infinity
-            and abs(val) > 1e-10  # Not negative infinity
-            and abs(val) < 1e12  # Not too close to zero  # Not absurdly large
-        )
+        # Not too close to zero, not absurdly large; NaN and ±inf fail both bounds
+        return 1e-10 < abs(val) < 1e12
 
     def _classify_numeric_values(
         self, values: list[tuple[int, float, str]]
@@ -828,11 +960,15 @@ class DexScraper:
         return classified
 
     def _extract_metadata_patterns(
-        self, data: bytes, data_start: int
+        self,
+        data: Union[bytes, memoryview],
+        data_start: int,
+        text: Optional[str] = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """Extract metadata patterns (addresses, URLs, protocols)."""
-        # Convert to text for pattern matching
-        printable_text = "".join(chr(b) if 32 <= b <= 126 else " " for b in data)
+        # Convert to text for pattern matching unless the caller already did
+        if text is None:
+            text = printable_text(data)
 
         metadata: dict[str, list[dict[str, Any]]] = {
             "addresses": [],
@@ -843,7 +979,7 @@ class DexScraper:
         }
 
         # Extract Solana addresses
-        addresses = self.address_pattern.findall(printable_text)
+        addresses = self.address_pattern.findall(text)
         seen_entries: set[tuple[str, int]] = set()
         for addr in addresses:
             if not self._is_probable_solana_address(addr):
@@ -851,7 +987,7 @@ class DexScraper:
 
             start = 0
             while True:
-                pos = printable_text.find(addr, start)
+                pos = text.find(addr, start)
                 if pos < 0:
                     break
                 key = (addr, pos)
@@ -867,9 +1003,9 @@ class DexScraper:
                 start = pos + 1
 
         # Extract URLs
-        urls = self.url_pattern.findall(printable_text)
+        urls = self.url_pattern.findall(text)
         for url in urls:
-            pos = printable_text.find(url)
+            pos = text.find(url)
             if pos >= 0:
                 metadata["urls"].append(
                     {
@@ -883,7 +1019,7 @@ class DexScraper:
         for protocol in self.protocol_patterns["protocols"]:
             start = 0
             while True:
-                pos = printable_text.lower().find(protocol.lower(), start)
+                pos = text.lower().find(protocol.lower(), start)
                 if pos == -1:
                     break
                 metadata["protocols"].append(
@@ -897,7 +1033,7 @@ class DexScraper:
         for indicator in self.protocol_patterns["age_indicators"]:
             start = 0
             while True:
-                pos = printable_text.lower().find(indicator.lower(), start)
+                pos = text.lower().find(indicator.lower(), start)
                 if pos == -1:
                     break
                 metadata["age_indicators"].append(
@@ -908,7 +1044,7 @@ class DexScraper:
                     break
 
         # Extract token symbols and names
-        token_symbols = self._extract_token_symbols(printable_text, data_start)
+        token_symbols = self._extract_token_symbols(text, data_start)
         metadata["tokens"].extend(token_symbols)
 
         return metadata
@@ -961,8 +1097,6 @@ class DexScraper:
         self, text: str, data_start: int
     ) -> list[dict[str, Any]]:
         """Extract potential token symbols and names from binary data."""
-        import re
-
         token_symbols: list[dict[str, Any]] = []
         symbol_counts: dict[str, int] = {}  # Track frequency of each symbol
 
@@ -1498,30 +1632,33 @@ class DexScraper:
     ) -> None:
         """Stream trading pairs with enhanced extraction capability."""
         while True:
+            # One connection serves pushed frames every 5 seconds; the stream
+            # ends when pushes stop and the next pass reconnects
+            batches = self.stream_token_batches(interval=5.0)
             try:
-                if use_enhanced_extraction:
-                    batch = await self.extract_token_data()
-                    if batch.tokens:
+                async for batch in batches:
+                    if not batch.tokens:
+                        continue
+                    if use_enhanced_extraction:
                         if callback:
                             callback(batch)
                         else:
                             await self._output_enhanced_batch(batch, output_format)
-                else:
-                    pairs = await self.get_pairs_once()
-                    if pairs:
+                    else:
+                        pairs = batch.to_trading_pairs()
                         if callback:
                             callback(pairs)
                         else:
                             await self._output_pairs(pairs, output_format)
 
-                await asyncio.sleep(5)  # Wait between extractions
-
             except KeyboardInterrupt:
                 logger.info("Streaming stopped by user")
                 break
             except Exception as e:
                 logger.error(f"Error in streaming: {e}")
                 await asyncio.sleep(10)
+            finally:
+                await batches.aclose()
 
     async def _output_enhanced_batch(
         self, batch: ExtractedTokenBatch, format_type: str
@@ -1537,19 +1674,20 @@ class DexScraper:
                 ],
                 "timestamp": batch.extraction_timestamp,
             }
-            print(json.dumps(output, separators=(",", ":"), default=str))
+            write_json_line(output)
 
         elif format_type == "ohlc":
             ohlc_data = batch.to_ohlc_batch()
-            for ohlc in ohlc_data[:10]:  # Top 10
-                print(
+            write_lines(
+                [
                     f"TOKEN,{ohlc.timestamp},{ohlc.open},{ohlc.high},{ohlc.low},{ohlc.close},{ohlc.volume}"
-                )
+                    for ohlc in ohlc_data[:10]  # Top 10
+                ]
+            )
 
         elif format_type == "mt5":
             ohlc_data = batch.to_ohlc_batch()
-            for ohlc in ohlc_data[:10]:  # Top 10
-                print(ohlc.to_mt5_format())
+            write_lines([ohlc.to_mt5_format() for ohlc in ohlc_data[:10]])  # Top 10
 
     async def _output_pairs(self, pairs: list[TradingPair], format_type: str) -> None:
         """Output pairs in specified format (legacy)."""
@@ -1559,21 +1697,21 @@ class DexScraper:
                 "pairs": [pair.to_dict() for pair in pairs],
                 "timestamp": int(time.time()),
             }
-            print(json.dumps(output, separators=(",", ":")))
+            write_json_line(output)
 
         elif format_type == "ohlc":
+            lines = []
             for pair in pairs:
                 ohlc = pair.to_ohlc()
                 if ohlc:
-                    print(
+                    lines.append(
                         f"{pair.base_token_symbol},{ohlc.timestamp},{ohlc.open},{ohlc.high},{ohlc.low},{ohlc.close},{ohlc.volume}"
                     )
+            write_lines(lines)
 
         elif format_type == "mt5":
-            for pair in pairs:
-                ohlc = pair.to_ohlc()
-                if ohlc:
-                    print(ohlc.to_mt5_format())
+            ohlc_rows = [pair.to_ohlc() for pair in pairs]
+            write_lines([ohlc.to_mt5_format() for ohlc in ohlc_rows if ohlc])
 
     async def run(
         self, output_format: str = "json", use_enhanced_extraction: bool = True
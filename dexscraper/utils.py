@@ -1,16 +1,124 @@
 """Utility functions for dexscraper package."""
 
 import asyncio
+import dataclasses
 import hashlib
+import json
+import math
+import random
 import re
 import struct
+import sys
 import time
-from datetime import datetime, timezone
-from typing import Any, Optional, TypeVar
-from collections.abc import Awaitable
+from datetime import date, datetime, timezone
+from datetime import time as dt_time
+from enum import Enum
+from typing import Any, Optional, TextIO, TypeVar, Union
+from collections.abc import Awaitable, Coroutine
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 T = TypeVar("T")
 
+# Maps bytes outside printable ASCII (0x20-0x7E) to spaces for bytes.translate
+_PRINTABLE_TEXT_MAP = bytes(b if 32 <= b <= 126 else 32 for b in range(256))
+
+
+def printable_text(data: Union[bytes, memoryview]) -> str:
+    """Render binary data as text, replacing non-printable bytes with spaces.
+
+    Args:
+        data: Binary data to render
+
+    Returns:
+        String of the same length containing only printable ASCII
+    """
+    return bytes(data).translate(_PRINTABLE_TEXT_MAP).decode("ascii")
+
+
+def unpack_at_offsets(
+    layout: struct.Struct,
+    data: Union[bytes, memoryview],
+    start: int,
+    stop: int,
+    step: int = 1,
+) -> list[Any]:
+    """Unpack a single-value struct layout at every offset in a range.
+
+    Offsets that share an alignment phase are decoded together with
+    ``iter_unpack`` over a memoryview, instead of one ``unpack_from`` call
+    per offset. Every offset must leave room for a full ``layout.size`` read.
+
+    Args:
+        layout: Precompiled struct holding exactly one value
+        data: Binary data to read from
+        start: First offset
+        stop: End of the offset range (exclusive)
+        step: Distance between offsets
+
+    Returns:
+        Unpacked values in offset order
+    """
+    offsets = range(start, stop, step)
+    size = layout.size
+    if size % step:
+        unpack_from = layout.unpack_from
+        return [unpack_from(data, offset)[0] for offset in offsets]
+
+    values: list[Any] = [None] * len(offsets)
+    view = memoryview(data)
+    phases = size // step
+    for phase in range(min(phases, len(offsets))):
+        begin = offsets[phase]
+        end = begin + len(offsets[phase::phases]) * size
+        values[phase::phases] = [
+            value for (value,) in layout.iter_unpack(view[begin:end])
+        ]
+    return values
+
+
+# Offsets decoded per unpack_at_offsets call when scanning for floats, so a
+# small ``count`` limit doesn't pay for decoding the whole buffer
+_SCAN_CHUNK = 1024
+_FLOAT32 = struct.Struct("<f")
+_FLOAT64 = struct.Struct("<d")
+
+
+def _extract_valid_values(
+    layout: struct.Struct, data: bytes, offset: int, count: Optional[int]
+) -> list[float]:
+    """Decode ``layout`` at every byte offset, keeping values that look valid.
+
+    Args:
+        layout: Precompiled single-value float struct
+        data: Binary data to extract from
+        offset: Starting offset in bytes
+        count: Maximum number of values to extract
+
+    Returns:
+        List of valid values in offset order
+    """
+    values: list[float] = []
+    stop = len(data) - layout.size + 1
+    for begin in range(max(offset, 0), stop, _SCAN_CHUNK):
+        chunk = unpack_at_offsets(layout, data, begin, min(begin + _SCAN_CHUNK, stop))
+        values.extend(value for value in chunk if is_valid_float(value))
+        if count and len(values) >= count:
+            return values[:count]
+    return values
+
 
 def extract_floats_from_bytes(
     data: bytes, offset: int = 0, count: Optional[int] = None
@@ -25,26 +133,8 @@ def extract_floats_from_bytes(
     Returns:
         List of extracted float values
     """
-    floats = []
-    pos = offset
-
-    while pos <= len(data) - 4:  # Need at least 4 bytes for a float
-        try:
-            value = struct.unpack("<f", data[pos : pos + 4])[0]  # Little-endian
-
-            # Filter out invalid/extreme values
-            if is_valid_float(value):
-                floats.append(value)
-
-            if count and len(floats) >= count:
-                break
-
-        except struct.error:
-            pass
-
-        pos += 1  # Move by 1 byte to find unaligned floats
-
-    return floats
+    # Little-endian, read at every byte to find unaligned floats
+    return _extract_valid_values(_FLOAT32, data, offset, count)
 
 
 def extract_doubles_from_bytes(
@@ -60,26 +150,8 @@ def extract_doubles_from_bytes(
     Returns:
         List of extracted double values
     """
-    doubles = []
-    pos = offset
-
-    while pos <= len(data) - 8:  # Need at least 8 bytes for a double
-        try:
-            value = struct.unpack("<d", data[pos : pos + 8])[0]  # Little-endian
-
-            # Filter out invalid/extreme values
-            if is_valid_float(value):
-                doubles.append(value)
-
-            if count and len(doubles) >= count:
-                break
-
-        except struct.error:
-            pass
-
-        pos += 1  # Move by 1 byte to find unaligned doubles
-
-    return doubles
+    # Little-endian, read at every byte to find unaligned doubles
+    return _extract_valid_values(_FLOAT64, data, offset, count)
 
 
 def is_valid_float(value: float) -> bool:
@@ -91,21 +163,17 @@ def is_valid_float(value: float) -> bool:
     Returns:
         True if value appears to be valid trading data
     """
-    import math
-
     # Check for NaN, infinity
     if not math.isfinite(value):
         return False
 
-    # Check for reasonable bounds (crypto prices/volumes)
-    if abs(value) < 1e-15 or abs(value) > 1e15:
+    # Check for reasonable bounds (crypto prices/volumes); this also rejects 0.0
+    magnitude = abs(value)
+    if magnitude < 1e-15 or magnitude > 1e15:
         return False
 
     # Check for suspicious patterns (like uninitialized memory)
-    if value == 0.0 or abs(value) == 1.0:
-        return False
-
-    return True
+    return magnitude != 1.0
 
 
 def extract_solana_addresses(data: bytes) -> list[str]:
@@ -315,10 +383,8 @@ def format_number(value: Optional[float], precision: int = 8) -> str:
     if value is None:
         return "N/A"
 
-    if abs(value) >= 1:
-        return f"{value:,.{precision}f}".rstrip("0").rstrip(".")
-    else:
-        return f"{value:.{precision}f}".rstrip("0").rstrip(".")
+    # Thousands separators never apply below 1, so one format covers both ranges
+    return f"{value:,.{precision}f}".rstrip("0").rstrip(".")
 
 
 def format_percentage(value: Optional[float]) -> str:
@@ -348,11 +414,12 @@ def format_volume(value: Optional[float]) -> str:
     if value is None:
         return "N/A"
 
-    if abs(value) >= 1_000_000_000:  # Billions
+    magnitude = abs(value)
+    if magnitude >= 1_000_000_000:  # Billions
         return f"${value / 1_000_000_000:.2f}B"
-    elif abs(value) >= 1_000_000:  # Millions
+    elif magnitude >= 1_000_000:  # Millions
         return f"${value / 1_000_000:.2f}M"
-    elif abs(value) >= 1_000:  # Thousands
+    elif magnitude >= 1_000:  # Thousands
         return f"${value / 1_000:.2f}K"
     else:
         return f"${value:.2f}"
@@ -426,7 +493,10 @@ async def with_timeout(coro: Awaitable[T], timeout_seconds: float) -> T:
 
 
 def exponential_backoff(
-    attempt: int, base_delay: float = 1.0, max_delay: float = 60.0
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    jitter: float = 0.0,
 ) -> float:
     """Calculate exponential backoff delay.
 
@@ -434,12 +504,17 @@ def exponential_backoff(
         attempt: Attempt number (0-based)
         base_delay: Base delay in seconds
         max_delay: Maximum delay in seconds
+        jitter: Fraction of the delay to randomize by, e.g. 0.25 for ±25%
 
     Returns:
         Delay in seconds
     """
     delay = base_delay * (2 ** min(attempt, 10))  # Cap at 2^10
-    return float(min(delay, max_delay))
+    delay = min(delay, max_delay)
+    if jitter:
+        # Spread retries so clients that failed together don't retry together
+        delay *= 1 + jitter * (2 * random.random() - 1)  # nosec B311
+    return float(delay)
 
 
 def validate_trading_data(price: Optional[float], volume: Optional[float]) -> bool:
@@ -504,3 +579,129 @@ class DataBuffer:
         """Clear buffer."""
         self.buffer.clear()
         self.index = 0
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode types orjson handles natively the way orjson does."""
+    if isinstance(obj, (date, dt_time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            field.name: getattr(obj, field.name)
+            for field in dataclasses.fields(obj)
+            if not field.name.startswith("_")
+        }
+    # UUIDs and anything else unknown are stringified
+    return str(obj)
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Return a copy of obj with NaN and infinite floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    return _replace_non_finite(_json_default(obj))
+
+
+def _stdlib_json_dumps(obj: Any, indent: bool) -> str:
+    layout: dict = {"indent": 2} if indent else {"separators": (",", ":")}
+    try:
+        return json.dumps(
+            obj, ensure_ascii=False, allow_nan=False, default=_json_default, **layout
+        )
+    except ValueError:
+        # Emit null for NaN/inf like orjson does instead of invalid JSON.
+        return json.dumps(
+            _replace_non_finite(obj),
+            ensure_ascii=False,
+            allow_nan=False,
+            default=_json_default,
+            **layout,
+        )
+
+
+def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to compact JSON bytes.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    Both paths decode to the same values: NaN and infinities become null,
+    int/float/bool/None keys are stringified, dates and times become ISO
+    strings, enums their value, dataclasses a dict of their public fields,
+    and integers wider than 64 bits go through the standard library. Float
+    spelling may differ (``0.00001`` vs ``1e-05``).
+
+    Args:
+        obj: JSON-compatible object; unknown types are stringified
+        indent: Pretty-print with two-space indentation instead
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option)
+        except TypeError:
+            pass
+    return _stdlib_json_dumps(obj, indent).encode("utf-8")
+
+
+def write_json_line(obj: Any, stream: Optional[TextIO] = None) -> None:
+    """Write an object as a single JSON line and flush it.
+
+    Args:
+        obj: JSON-compatible object
+        stream: Text stream to write to (defaults to ``sys.stdout``)
+    """
+    stream = sys.stdout if stream is None else stream
+    line = json_dumps_bytes(obj) + b"\n"
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(line.decode("utf-8"))
+        stream.flush()
+        return
+
+    # Flush pending text first so lines stay in order with print() output
+    stream.flush()
+    buffer.write(line)
+    buffer.flush()
+
+
+def write_lines(lines: list[str], stream: Optional[TextIO] = None) -> None:
+    """Write a batch of text lines with one write and one flush.
+
+    Args:
+        lines: Output lines without trailing newlines
+        stream: Text stream to write to (defaults to ``sys.stdout``)
+    """
+    if not lines:
+        return
+    stream = sys.stdout if stream is None else stream
+    stream.write("\n".join(lines) + "\n")
+    stream.flush()
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Uses ``uvloop.run`` when it is available (uvloop 0.18+) and falls back
+    to ``asyncio.run``.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        Coroutine result
+    """
+    if UVLOOP_AVAILABLE and hasattr(uvloop, "run"):
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -2,11 +2,13 @@
 """Test cases for CLI functionality."""
 
 import argparse
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from dexscraper.cli import (
+    build_batch_output,
     build_config_from_args,
     create_token_callback,
     emit_cloudflare_runtime_warning,
@@ -15,6 +17,7 @@ from dexscraper.cli import (
     parse_rank_by,
     parse_timeframe,
     SlickCLI,
+    STREAM_REFRESH_SECONDS,
 )
 from dexscraper.config import Chain, DEX, RankBy, ScrapingConfig, Timeframe
 from dexscraper.models import ExtractedTokenBatch, TokenProfile
@@ -358,6 +361,60 @@ class TestCallbacks:
         output = output_buffer.getvalue()
         assert "DateTime,Open,High,Low,Close,Volume,Trades" in output
 
+    def test_json_token_callback_writes_bytes_to_binary_stdout(self):
+        """With a byte buffer available, the JSON line bypasses text encoding."""
+        import io
+        import json
+
+        callback = create_token_callback("json")
+        batch = ExtractedTokenBatch(
+            tokens=[TokenProfile(symbol="ÅBC", price=0.001, volume_24h=1000)]
+        )
+        binary = io.BytesIO()
+        stdout = io.TextIOWrapper(binary, encoding="utf-8")
+
+        with patch("sys.stdout", stdout):
+            callback(batch)
+
+        raw = binary.getvalue()
+        assert raw.endswith(b"\n") and raw.count(b"\n") == 1
+        payload = json.loads(raw)
+        assert payload["type"] == "enhanced_tokens"
+        assert payload["tokens"][0]["symbol"] == "ÅBC"
+
+    def test_build_batch_output_json_is_compact_utf8(self):
+        """One-shot JSON output matches the streaming callback's encoding."""
+        import json
+
+        batch = ExtractedTokenBatch(
+            tokens=[TokenProfile(symbol="ÅBC", price=0.001, volume_24h=1000)]
+        )
+
+        serialized = build_batch_output(batch, "json", limit=5)
+
+        assert isinstance(serialized, str)
+        assert '"type":"enhanced_tokens"' in serialized
+        assert "ÅBC" in serialized
+        assert json.loads(serialized)["total_extracted"] == 1
+
+    def test_text_token_callback_writes_batch_at_once(self):
+        """Summary and token lines go out in a single stdout write."""
+        callback = create_token_callback("text")
+        tokens = [
+            TokenProfile(symbol="TEST1", price=0.001, volume_24h=1000),
+            TokenProfile(symbol="TEST2", price=None, volume_24h=2000),
+        ]
+        batch = ExtractedTokenBatch(tokens=tokens)
+
+        with patch("sys.stdout") as stdout:
+            callback(batch)
+
+        stdout.write.assert_called_once()
+        lines = stdout.write.call_args.args[0].splitlines()
+        assert lines[0].startswith("📊 Extracted 2 tokens")
+        assert len(lines) == 2
+        assert "TEST1" in lines[1]
+
 
 class TestSlickCLI:
     """Test Rich display functionality."""
@@ -406,6 +463,192 @@ class TestSlickCLI:
         except ImportError:
             pytest.skip("Rich not available")
 
+    @pytest.mark.asyncio
+    async def test_stream_mode_updates_live_display_in_place(self):
+        """Refreshes update one Live display instead of clearing and reprinting."""
+        pytest.importorskip("rich")
+        display = SlickCLI()
+        display.console = Mock()
+        batch = ExtractedTokenBatch(
+            tokens=[TokenProfile(symbol="TEST1", price=0.001, volume_24h=1000)]
+        )
+        extract = AsyncMock(return_value=batch)
+
+        with (
+            patch.object(display, "extract_data", extract),
+            patch("dexscraper.cli.Live") as mock_live,
+            patch(
+                "dexscraper.cli.asyncio.sleep",
+                AsyncMock(side_effect=[None, KeyboardInterrupt]),
+            ),
+        ):
+            await display.stream_mode()
+
+        live = mock_live.return_value.__enter__.return_value
+        assert live.update.call_count == 1
+        assert mock_live.call_args.kwargs["screen"] is True
+        # Only the first fetch shows a spinner; later ones run under Live
+        assert extract.await_args_list[1].kwargs == {"show_progress": False}
+        assert display.console.clear.call_count == 1
+
+    def test_static_renderables_are_reused_across_frames(self):
+        """The header panel and table column spec are built once, not per frame."""
+        pytest.importorskip("rich")
+        display = SlickCLI()
+        batch = ExtractedTokenBatch(
+            tokens=[TokenProfile(symbol="TEST1", price=0.001, volume_24h=1000)]
+        )
+
+        first = display.create_layout(batch)
+        with patch.object(display, "create_header_panel") as header:
+            second = display.create_layout(batch)
+
+        header.assert_not_called()
+        assert first["header"].renderable is second["header"].renderable
+        table = display.create_slick_token_table(batch)
+        assert [c.header for c in table.columns] == [
+            "Token",
+            "Price",
+            "Volume",
+            "Txns",
+            "Makers",
+            "Conf",
+        ]
+        assert table.row_count == 1
+
+    def test_static_renderables_are_built_lazily(self):
+        """Callback-only instances never build the menu and stream renderables."""
+        pytest.importorskip("rich")
+
+        with patch.object(SlickCLI, "create_header_panel") as header:
+            display = SlickCLI()
+            header.assert_not_called()
+            display.create_layout(ExtractedTokenBatch())
+            display.create_layout(ExtractedTokenBatch())
+
+        header.assert_called_once()
+        assert "_stream_rule" not in vars(display)
+
+    def test_stats_panel_reads_clock_once(self):
+        """Uptime and the displayed time both derive from a single timestamp."""
+        rich_console = pytest.importorskip("rich.console")
+        display = SlickCLI()
+        display.session_start = 1_700_000_000.0
+        batch = ExtractedTokenBatch(tokens=[TokenProfile(symbol="TEST1")])
+        console = rich_console.Console(width=120, record=True)
+
+        with patch("dexscraper.cli.time.time") as clock:
+            panel = display.create_stats_panel(batch, now=1_700_000_042.0)
+            console.print(panel)
+
+        clock.assert_not_called()
+        assert "Uptime: 42s" in console.export_text()
+
+    def test_token_table_confidence_icons(self):
+        """Confidence bands map to icons with inclusive lower bounds."""
+        pytest.importorskip("rich")
+        display = SlickCLI()
+        scores = [0.9, 0.8, 0.6, 0.4, 0.39]
+        batch = ExtractedTokenBatch(
+            tokens=[
+                TokenProfile(symbol=f"T{i}", price=0.001, confidence_score=score)
+                for i, score in enumerate(scores)
+            ]
+        )
+
+        table = display.create_slick_token_table(batch)
+
+        assert list(table.columns[-1].cells) == ["⚡", "⚡", "⭐", "🟡", "🔴"]
+
+    @pytest.mark.asyncio
+    async def test_stream_mode_fetches_so_frames_land_on_the_deadline(self):
+        """The refresh wait is shortened by the last fetch time, not prefetched."""
+        pytest.importorskip("rich")
+        display = SlickCLI()
+        display.console = Mock()
+        batch = ExtractedTokenBatch(tokens=[TokenProfile(symbol="TEST1")])
+        clock = iter([100.0, 101.5, 200.0, 200.5])
+
+        with (
+            patch.object(display, "extract_data", AsyncMock(return_value=batch)),
+            patch("dexscraper.cli.Live"),
+            patch("dexscraper.cli.time.monotonic", side_effect=lambda: next(clock)),
+            patch(
+                "dexscraper.cli.asyncio.sleep",
+                AsyncMock(side_effect=[None, None, KeyboardInterrupt]),
+            ) as sleep,
+        ):
+            await display.stream_mode()
+
+        assert [c.args[0] for c in sleep.await_args_list] == [
+            STREAM_REFRESH_SECONDS,
+            STREAM_REFRESH_SECONDS - 1.5,
+            STREAM_REFRESH_SECONDS - 0.5,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_fetch_before_stream_is_chosen(self):
+        """Quitting from the menu never opens a connection."""
+        pytest.importorskip("rich")
+        display = SlickCLI()
+        display.console = MagicMock()
+
+        with (
+            patch.object(display, "extract_data", AsyncMock()) as extract,
+            patch.object(display, "show_ghost_loading", AsyncMock()),
+            patch.object(display, "show_main_menu", return_value="5"),
+            patch("dexscraper.cli.asyncio.sleep", AsyncMock()),
+        ):
+            await display.run()
+
+        extract.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_splash_delays_do_not_block_the_event_loop(self):
+        """Decorative pauses yield to the loop instead of sleeping the thread."""
+        pytest.importorskip("rich")
+        display = SlickCLI()
+        display.console = MagicMock()
+
+        with (
+            patch("dexscraper.cli.asyncio.sleep", AsyncMock()) as sleep,
+            patch("time.sleep") as blocking_sleep,
+        ):
+            await display.show_ghost_loading()
+            await display.show_startup_animation()
+
+        assert sleep.await_count == 6
+        blocking_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("choice, suffix", [("1", ".json"), ("2", ".csv")])
+    async def test_export_mode_writes_file_off_loop(
+        self, choice, suffix, tmp_path, monkeypatch
+    ):
+        """Exports are written in a worker thread and land in the working dir."""
+        pytest.importorskip("rich")
+        monkeypatch.chdir(tmp_path)
+        display = SlickCLI()
+        display.console = Mock()
+        batch = ExtractedTokenBatch(
+            tokens=[TokenProfile(symbol="TEST1", price=0.001, volume_24h=1000)]
+        )
+
+        with (
+            patch.object(display, "extract_data", AsyncMock(return_value=batch)),
+            patch("dexscraper.cli.Prompt.ask", return_value=choice),
+            patch("builtins.input", return_value=""),
+            patch(
+                "dexscraper.cli.asyncio.to_thread", wraps=asyncio.to_thread
+            ) as to_thread,
+        ):
+            await display.export_mode()
+
+        to_thread.assert_awaited_once()
+        (exported,) = tmp_path.iterdir()
+        assert exported.suffix == suffix
+        assert "0.001" in exported.read_text(encoding="utf-8")
+
 
 class TestCLIIntegration:
     """Integration tests for CLI functionality."""
@@ -460,6 +703,101 @@ class TestCLIIntegration:
                     mock_scraper_class.call_args.kwargs["use_cloudflare_bypass"] is True
                 )
 
+    @pytest.mark.asyncio
+    async def test_cli_passes_connection_options_to_scraper(self):
+        """Test --rate-limit and --max-retries reach DexScraper."""
+        from dexscraper.cli import main
+
+        test_args = ["dexscraper", "--once", "-r", "0.5", "-m", "2"]
+
+        with patch("sys.argv", test_args):
+            with patch("dexscraper.cli.DexScraper") as mock_scraper_class:
+                mock_scraper_class.return_value.extract_token_data = AsyncMock(
+                    return_value=ExtractedTokenBatch(
+                        tokens=[TokenProfile(symbol="TEST", price=0.001)]
+                    )
+                )
+                with patch("dexscraper.cli.write_json_line"):
+                    await main()
+
+        kwargs = mock_scraper_class.call_args.kwargs
+        assert kwargs["rate_limit"] == 0.5
+        assert kwargs["max_retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cli_stream_reuses_connection_and_backs_off(self):
+        """Test streaming emits every paced batch and backs off on drops."""
+        from dexscraper.cli import main
+
+        batch = ExtractedTokenBatch(tokens=[TokenProfile(symbol="TEST", price=0.001)])
+        connections = []
+
+        async def stream_token_batches(interval):
+            connections.append(interval)
+            if len(connections) in (2, 3):
+                raise ConnectionError("refused")
+            yield batch
+            yield batch
+            raise ConnectionError("dropped")
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            if len(delays) == 4:
+                raise asyncio.CancelledError
+
+        with patch("sys.argv", ["dexscraper", "--format", "json"]):
+            with patch("dexscraper.cli.DexScraper") as mock_scraper_class:
+                mock_scraper_class.return_value.stream_token_batches = (
+                    stream_token_batches
+                )
+                with (
+                    patch("dexscraper.cli.asyncio.sleep", fake_sleep),
+                    patch("dexscraper.cli.write_json_line") as write,
+                ):
+                    with pytest.raises(asyncio.CancelledError):
+                        await main()
+
+        # Pacing happens in the scraper, before frames are parsed
+        assert set(connections) == {5.0}
+        assert write.call_count == 4
+        # Refused reconnects back off further; a delivered batch resets it
+        for delay, expected in zip(delays, [10.0, 20.0, 40.0, 10.0]):
+            assert expected * 0.75 <= delay <= expected * 1.25
+        assert delays[1] > delays[0] and delays[2] > delays[1]
+
+    @pytest.mark.asyncio
+    async def test_cli_stream_reconnects_at_once_when_pushes_stop(self):
+        """Test a stream that ends without error reconnects without backoff."""
+        from dexscraper.cli import main
+
+        connections = []
+
+        async def stream_token_batches(interval):
+            connections.append(interval)
+            if len(connections) == 3:
+                raise asyncio.CancelledError
+            yield ExtractedTokenBatch(
+                tokens=[TokenProfile(symbol=f"T{len(connections)}", price=0.001)]
+            )
+
+        with patch("sys.argv", ["dexscraper", "--format", "json"]):
+            with patch("dexscraper.cli.DexScraper") as mock_scraper_class:
+                mock_scraper_class.return_value.stream_token_batches = (
+                    stream_token_batches
+                )
+                with (
+                    patch("dexscraper.cli.asyncio.sleep", AsyncMock()) as sleep,
+                    patch("dexscraper.cli.write_json_line") as write,
+                ):
+                    with pytest.raises(asyncio.CancelledError):
+                        await main()
+
+        emitted = [call.args[0]["tokens"][0]["symbol"] for call in write.call_args_list]
+        assert emitted == ["T1", "T2"]
+        sleep.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_cli_argument_parsing(self):
         """Test CLI argument parsing with various combinations."""
@@ -68,17 +68,48 @@ class TestCloudflareBypass:
         ) as create_scraper:
             bypass = CloudflareBypass()
 
-            with patch.object(
-                bypass,
-                "_make_request",
-                side_effect=[Mock(status_code=403), Mock(status_code=200)],
+            with (
+                patch.object(
+                    bypass,
+                    "_make_request",
+                    side_effect=[Mock(status_code=403), Mock(status_code=200)],
+                ),
+                patch(
+                    "dexscraper.cloudflare_bypass.asyncio.sleep", new_callable=AsyncMock
+                ) as sleep_mock,
             ):
                 cookies = await bypass.get_session_cookies("wss://io.dexscreener.com")
 
         assert create_scraper.call_count == 2
+        sleep_mock.assert_awaited_once()
         assert cookies == {"cf_clearance": "new"}
         assert bypass._session_cookies == {"cf_clearance": "new"}
 
+    @pytest.mark.asyncio
+    async def test_session_retries_back_off_until_exhausted(self):
+        """Should back off between session refreshes and give up after retries."""
+        with patch(
+            "dexscraper.cloudflare_bypass.cloudscraper.create_scraper",
+            side_effect=lambda **_: Mock(cookies={}, headers={}),
+        ) as create_scraper:
+            bypass = CloudflareBypass()
+
+            with (
+                patch.object(
+                    bypass, "_make_request", return_value=Mock(status_code=503)
+                ) as make_request,
+                patch("dexscraper.cloudflare_bypass.random.uniform", return_value=0.25),
+                patch(
+                    "dexscraper.cloudflare_bypass.asyncio.sleep", new_callable=AsyncMock
+                ) as sleep_mock,
+            ):
+                cookies = await bypass.get_session_cookies("wss://io.dexscreener.com")
+
+        assert cookies == {}
+        assert make_request.call_count == 3
+        assert create_scraper.call_count == 3
+        assert [call.args[0] for call in sleep_mock.await_args_list] == [1.25, 2.25]
+
     @pytest.mark.asyncio
     async def test_session_cache_is_reused(self):
         """Should return cached cookies when within TTL."""
@@ -124,3 +155,31 @@ class TestCloudflareBypass:
         assert data["cookies"] == {"a": "1", "b": "2"}
         assert data["user_agent"] == "ua-test"
         assert set(data["cookie_header"].split("; ")) == {"a=1", "b=2"}
+
+    @pytest.mark.asyncio
+    async def test_cookie_header_built_when_cookies_are_stored(self):
+        """Should join the cookie header once per stored cookie set."""
+        scraper = Mock()
+        scraper.cookies = {"cf_clearance": "cached"}
+        scraper.headers = {"User-Agent": "ua-test"}
+
+        with patch(
+            "dexscraper.cloudflare_bypass.cloudscraper.create_scraper",
+            return_value=scraper,
+        ):
+            bypass = CloudflareBypass()
+
+        bypass._store_session_cookies()
+        first = await bypass.prepare_websocket_connection("wss://io.dexscreener.com")
+        second = await bypass.prepare_websocket_connection("wss://io.dexscreener.com")
+        assert first["cookie_header"] == "cf_clearance=cached"
+        assert second["cookie_header"] is first["cookie_header"]
+
+        scraper.cookies = {"cf_clearance": "fresh", "__cf_bm": "bm"}
+        bypass._store_session_cookies()
+        third = await bypass.prepare_websocket_connection("wss://io.dexscreener.com")
+        assert third["cookie_header"] == "cf_clearance=fresh; __cf_bm=bm"
+
+        with patch.object(bypass, "_create_scraper", return_value=scraper):
+            bypass._refresh_session()
+        assert bypass._cookie_header == ""
@@ -35,6 +35,25 @@ class TestFilters:
         assert params["profile"] == "1"
         assert params["maxLaunchpadProgress"] == "99.99"
 
+    def test_every_scalar_filter_maps_to_a_query_key(self):
+        """Test each scalar Filters field is emitted when set."""
+        from dataclasses import fields
+
+        from dexscraper.config import _FILTER_QUERY_KEYS
+
+        scalar_fields = {
+            f.name for f in fields(Filters) if f.name not in ("chain_ids", "dex_ids")
+        }
+        assert {attr for attr, _ in _FILTER_QUERY_KEYS} == scalar_fields
+
+        params = Filters(
+            chain_ids=[], enhanced_token_info=True, fdv_max=7
+        ).to_query_params()
+        assert params == {
+            "filters[fdv][max]": "7",
+            "filters[enhancedTokenInfo]": "true",
+        }
+
     def test_complex_filters(self):
         """Test complex filter combinations."""
         filters = Filters(
@@ -127,6 +146,14 @@ class TestScrapingConfig:
         assert "profile=1" in url
         assert "maxLaunchpadProgress=99.99" in url
 
+    def test_url_values_are_percent_encoded(self):
+        """Test query values are escaped while filter key brackets stay readable."""
+        config = ScrapingConfig(filters=Filters(fdv_max=1e20))
+        url = config.build_websocket_url()
+
+        assert "filters[fdv][max]=1e%2B20" in url
+        assert "filters[chainIds][0]=solana" in url
+
 
 class TestPresetConfigs:
     """Test preset configuration builders."""
@@ -2,7 +2,20 @@ import os
 import sys
 import types
 
-from dexscraper.protocol import clean_string, decode_pair
+import struct
+from datetime import datetime
+from unittest.mock import patch
+
+from dexscraper.protocol import (
+    clean_bytes,
+    clean_string,
+    decode_pair,
+    decode_pair_data,
+    find_pairs_tag,
+    format_created_at,
+    handle_double,
+    parse_message,
+)
 
 # Ensure the project root is on the import path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -31,3 +44,68 @@ def test_decode_pair_invalid_length_returns_none():
     # Declared length exceeds remaining bytes
     data_short = b"\x0ahello"
     assert decode_pair(data_short) is None
+
+
+def test_clean_bytes_matches_clean_string():
+    raw = "tok\x00en\xe9 \x7fname@junk".encode("utf-8")
+    assert clean_bytes(raw) == clean_string(raw.decode("utf-8")) == "token name"
+
+
+def test_decode_pair_data_reports_consumed_offset():
+    fields = [b"bsc", b"v2", b"0xpair", b"Token", b"TKN", b"0xbase"]
+    record = b"".join(bytes([len(f)]) + f for f in fields)
+    record += b"\x00" * (-len(record) % 8)
+    record += struct.pack("<8d", 1.5, 1.5, 2.0, 1000.0, 500.0, 9000.0, 0.0, 0.0)
+
+    prefix = b"\x01" * 8
+    data = prefix + record + b"\x07" * 64
+    pair, next_pos = decode_pair_data(data, len(prefix), len(data))
+
+    assert pair is not None
+    assert pair.base_token_symbol == "TKN"
+    assert next_pos == len(prefix) + len(record)
+    assert decode_pair(record).pair_address == "0xpair"
+
+    # Decoding from a memoryview gives the same result without copying
+    assert decode_pair_data(memoryview(data), len(prefix), len(data)) == (
+        pair,
+        next_pos,
+    )
+
+
+def test_find_pairs_tag_falls_back_past_header_window():
+    assert find_pairs_tag(b"\x00\n1.3.0\n\x04pairs") == 9
+    assert find_pairs_tag(b"\x00" * 300 + b"pairs") == 300
+    assert find_pairs_tag(b"no tag here") == -1
+
+
+def test_format_created_at_matches_datetime():
+    for ts in (0, 1_700_000_000, 4_102_444_799):
+        expected = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+        assert format_created_at(ts) == expected
+
+
+def test_handle_double_zeroes_non_finite_values():
+    assert handle_double(1.25) == 1.25
+    assert handle_double(float("nan")) == 0.0
+    assert handle_double(float("-inf")) == 0.0
+    assert handle_double("1.0") == 0.0
+
+
+def _pair_record(symbol: bytes) -> bytes:
+    fields = [b"bsc", b"v2", b"0xpair" + symbol, b"Token" + symbol, symbol, b"0xb"]
+    record = b"".join(bytes([len(f)]) + f for f in fields)
+    record += b"\x00" * (-len(record) % 8)
+    return record + struct.pack("<8d", 1.5, 1.5, 2.0, 1e3, 500.0, 9e3, 0.0, 0.0)
+
+
+def test_parse_message_walks_back_to_back_records():
+    symbols = [b"T%02d" % i for i in range(12)]
+    body = b"".join(_pair_record(symbol) for symbol in symbols)
+    message = b"\x00\n1.3.0\n\x05pairs\x00\x00\x00\x00" + body + b"\x00" * 600
+
+    # Exercise the binary fallback rather than the enhanced heuristics
+    with patch("dexscraper.enhanced_protocol.parse_message_enhanced", return_value=[]):
+        pairs = parse_message(message)
+
+    assert [pair.base_token_symbol for pair in pairs] == [s.decode() for s in symbols]
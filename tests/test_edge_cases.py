@@ -2,20 +2,36 @@
 """Test edge cases and scenarios identified in ANALYSIS.md."""
 
 import asyncio
+import io
+import json
+import struct
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from enum import Enum
 from unittest.mock import patch
 
 import pytest
 
 from dexscraper import DexScraper
+from dexscraper.enhanced_protocol import EnhancedProtocolParser
 from dexscraper.models import ExtractedTokenBatch, OHLCData, TokenProfile
 from dexscraper.utils import (
     cluster_numeric_values,
+    exponential_backoff,
     extract_doubles_from_bytes,
     extract_floats_from_bytes,
     extract_solana_addresses,
     extract_urls,
+    format_number,
+    format_volume,
     is_valid_float,
+    json_dumps_bytes,
+    printable_text,
+    run_async,
+    unpack_at_offsets,
     validate_trading_data,
+    write_json_line,
 )
 
 
@@ -126,6 +142,64 @@ class TestBinaryProtocolEdgeCases:
                     f"Should be invalid: price={price}, volume={volume}"
                 )
 
+    def test_bulk_unpack_matches_per_offset_unpack(self):
+        """Phase-wise bulk decoding must match unpacking offset by offset."""
+        data = bytes(range(7, 250, 3)) + struct.pack("<d", 1234.5) + b"\x01\x02"
+        for layout in (struct.Struct("<d"), struct.Struct("<f"), struct.Struct("<I")):
+            for step in (1, 2, 3, 4, 8):
+                stop = len(data) - layout.size + 1
+                expected = [
+                    layout.unpack_from(data, offset)[0]
+                    for offset in range(1, stop, step)
+                ]
+                actual = unpack_at_offsets(layout, data, 1, stop, step)
+                assert struct.pack(f"<{len(actual)}d", *actual) == struct.pack(
+                    f"<{len(expected)}d", *expected
+                )
+
+        assert unpack_at_offsets(struct.Struct("<d"), b"short", 0, -3) == []
+
+    def test_float_scan_across_chunks_respects_count(self):
+        """Byte-wise scans spanning several decode chunks honour offset and count."""
+        values = [float(i) + 0.5 for i in range(1, 400)]
+        data = b"\x00" * 3 + struct.pack(f"<{len(values)}d", *values)
+
+        doubles = extract_doubles_from_bytes(data, offset=3)
+        remaining = iter(doubles)
+        assert all(value in remaining for value in values)
+        assert extract_doubles_from_bytes(data, offset=3, count=5) == doubles[:5]
+        assert len(extract_floats_from_bytes(data, count=7)) == 7
+        assert extract_floats_from_bytes(data, offset=len(data)) == []
+
+    def test_printable_text_matches_per_byte_rendering(self):
+        """Non-printable bytes become spaces and the length is preserved."""
+        data = bytes(range(256))
+        expected = "".join(chr(b) if 32 <= b <= 126 else " " for b in data)
+        assert printable_text(data) == expected
+        assert printable_text(memoryview(b"ab\x00c")) == "ab c"
+
+    def test_exponential_backoff_jitter_stays_within_bounds(self):
+        """Jitter spreads the capped delay by at most the given fraction."""
+        assert exponential_backoff(3, base_delay=10.0, max_delay=60.0) == 60.0
+
+        with patch("dexscraper.utils.random.random", side_effect=[0.0, 1.0, 0.5]):
+            low = exponential_backoff(3, base_delay=10.0, max_delay=60.0, jitter=0.25)
+            high = exponential_backoff(1, base_delay=10.0, max_delay=60.0, jitter=0.25)
+            mid = exponential_backoff(0, base_delay=10.0, max_delay=60.0, jitter=0.25)
+
+        assert (low, high, mid) == (45.0, 25.0, 10.0)
+
+    def test_number_formatting(self):
+        """Test trimming of trailing zeros and thousands separators."""
+        assert format_number(None) == "N/A"
+        assert format_number(1234.5) == "1,234.5"
+        assert format_number(0.00012300) == "0.000123"
+        assert format_number(-2500.0, precision=2) == "-2,500"
+
+        assert format_volume(None) == "N/A"
+        assert format_volume(-2_500_000.0) == "$-2.50M"
+        assert format_volume(999.994) == "$999.99"
+
     def test_solana_address_patterns(self):
         """Test Solana address extraction patterns."""
         # Test with realistic Solana addresses from the screenshots
@@ -158,6 +232,57 @@ class TestBinaryProtocolEdgeCases:
                 f"Should extract URL component from: {url}"
             )
 
+    def test_numeric_clusters_match_per_window_extraction(self):
+        """Shared cluster scan should categorise each window like a direct scan."""
+        parser = EnhancedProtocolParser()
+        record = bytearray(128)
+        struct.pack_into("<d", record, 8, 0.0005)  # price
+        struct.pack_into("<d", record, 24, 250000.0)  # volume
+        struct.pack_into("<f", record, 42, 1500.0)  # float volume
+        struct.pack_into("<d", record, 64, 42.0)  # count
+        data = bytes(b"\x07" * 20 + record * 4 + b"\x07" * 30)
+
+        clusters = parser._find_numeric_clusters(data)
+
+        assert clusters
+        for offset, cluster_data in clusters:
+            window = data[offset : offset + 128]
+            assert cluster_data == parser._extract_numeric_from_window(window)
+
+        window_data = parser._extract_numeric_from_window(bytes(record))
+        assert window_data["prices"] == [(8, 0.0005)]
+        assert (24, 250000.0) in window_data["volumes"]
+        assert (42, 1500.0) in window_data["volumes"]
+        assert window_data["counts"] == [(64, 42.0)]
+
+    def test_deduplicate_clusters_keeps_richest_non_overlapping(self):
+        """Overlapping clusters should yield to richer ones, capped at 20."""
+        parser = EnhancedProtocolParser()
+
+        def cluster(offset, richness):
+            return (offset, {"prices": [(0, 0.0005)] * richness})
+
+        kept = parser._deduplicate_clusters(
+            [cluster(0, 1), cluster(64, 3), cluster(128, 1), cluster(192, 2)]
+        )
+        assert [offset for offset, _ in kept] == [64, 192]
+
+        many = [cluster(offset, 1) for offset in range(0, 128 * 30, 128)]
+        assert len(parser._deduplicate_clusters(many)) == 20
+
+    def test_cluster_text_words_split_on_non_printable_bytes(self):
+        """Cluster text should split on control/high bytes and spaces alike."""
+        parser = EnhancedProtocolParser()
+        data = b"\x00ethereum\x01Raydium \xffPEPE\x02$wif_hat\x7fx" + bytes(64)
+        cluster_data = {"prices": [], "volumes": [], "liquidity": []}
+
+        pair = parser._parse_pair_from_cluster(data, 0, cluster_data)
+
+        assert pair.chain == "ethereum"
+        assert pair.protocol == "raydium"
+        assert pair.base_token_symbol == "PEPE"
+        assert pair.base_token_name == "ethereum"
+
 
 class TestTokenProfileEdgeCases:
     """Test TokenProfile edge cases and validation."""
@@ -394,5 +519,129 @@ class TestWebSocketEdgeCases:
         assert slow_scraper._min_interval == 10.0
 
 
+class TestJsonOutputEdgeCases:
+    """Test JSON line output across stream types."""
+
+    def test_json_dumps_bytes_stringifies_unknown_types(self):
+        """Non-JSON values fall back to str() with either backend."""
+        payload = json.loads(json_dumps_bytes({"a": 1.5, "b": object()}))
+        assert payload["a"] == 1.5
+        assert isinstance(payload["b"], str)
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_json_dumps_bytes_indent_matches_stdlib_layout(self, orjson_available):
+        """Indented output uses the two-space layout of json.dumps(indent=2)."""
+        if orjson_available:
+            pytest.importorskip("orjson")
+        data = [{"symbol": "ÅBC", "price": 0.5, "tags": [1, 2]}]
+        with patch("dexscraper.utils.ORJSON_AVAILABLE", orjson_available):
+            encoded = json_dumps_bytes(data, indent=True)
+
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        assert encoded.decode("utf-8") == expected
+
+    @pytest.mark.parametrize("indent", [False, True])
+    def test_json_dumps_bytes_backends_agree(self, indent):
+        """Both backends accept the same payload and decode to the same values."""
+        pytest.importorskip("orjson")
+        payload = {
+            "nan": float("nan"),
+            "inf": [float("-inf"), 1e-05],
+            1: "int key",
+            None: "none key",
+            "big": 2**70,
+            "name": "ÅBC",
+        }
+        outputs = []
+        for orjson_available in (True, False):
+            with patch("dexscraper.utils.ORJSON_AVAILABLE", orjson_available):
+                outputs.append(json_dumps_bytes(payload, indent=indent))
+
+        fast, stdlib = (json.loads(output) for output in outputs)
+        assert fast == stdlib
+        assert stdlib["nan"] is None
+        assert stdlib["inf"] == [None, 1e-05]
+        assert stdlib["1"] == "int key"
+        assert stdlib["null"] == "none key"
+        assert stdlib["big"] == 2**70
+
+        small = {"symbol": "ÅBC", "price": 0.5, 2: [1, None, True]}
+        with patch("dexscraper.utils.ORJSON_AVAILABLE", True):
+            fast_bytes = json_dumps_bytes(small, indent=indent)
+        with patch("dexscraper.utils.ORJSON_AVAILABLE", False):
+            assert json_dumps_bytes(small, indent=indent) == fast_bytes
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_json_dumps_bytes_encodes_rich_types_like_orjson(self, orjson_available):
+        """Dates, enums, dataclasses and UUIDs serialize alike on both backends."""
+        if orjson_available:
+            pytest.importorskip("orjson")
+
+        class Side(Enum):
+            BUY = "buy"
+
+        @dataclass
+        class Fill:
+            side: Side
+            when: date
+            ratio: float
+            _internal: int = 0
+
+        payload = {
+            "at": datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+            "id": uuid.UUID(int=5),
+            "side": Side.BUY,
+            "fill": Fill(Side.BUY, date(2024, 1, 2), float("nan")),
+        }
+        with patch("dexscraper.utils.ORJSON_AVAILABLE", orjson_available):
+            encoded = json_dumps_bytes(payload)
+
+        assert json.loads(encoded) == {
+            "at": "2024-01-02T03:04:05.000006+00:00",
+            "id": "00000000-0000-0000-0000-000000000005",
+            "side": "buy",
+            "fill": {"side": "buy", "when": "2024-01-02", "ratio": None},
+        }
+
+    def test_write_json_line_to_text_and_binary_streams(self):
+        """Streams with and without a byte buffer receive identical lines."""
+        text_stream = io.StringIO()
+        write_json_line({"type": "tokens", "count": 2}, text_stream)
+
+        binary = io.BytesIO()
+        wrapped = io.TextIOWrapper(binary, encoding="utf-8")
+        write_json_line({"type": "tokens", "count": 2}, wrapped)
+
+        assert text_stream.getvalue() == binary.getvalue().decode("utf-8")
+        assert json.loads(text_stream.getvalue()) == {"type": "tokens", "count": 2}
+        assert text_stream.getvalue().endswith("\n")
+
+
+class TestEventLoopEdgeCases:
+    """Test event loop selection for the entry points."""
+
+    def test_run_async_returns_coroutine_result(self):
+        """run_async drives a coroutine on uvloop or asyncio alike."""
+
+        async def answer():
+            await asyncio.sleep(0)
+            return 42
+
+        assert run_async(answer()) == 42
+
+    def test_run_async_falls_back_without_uvloop_run(self):
+        """uvloop releases before 0.18 have no run(); use asyncio.run instead."""
+
+        async def answer():
+            return 7
+
+        old_uvloop = object()
+        with (
+            patch("dexscraper.utils.UVLOOP_AVAILABLE", True),
+            patch("dexscraper.utils.uvloop", old_uvloop, create=True),
+        ):
+            assert run_async(answer()) == 7
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
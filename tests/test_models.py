@@ -39,6 +39,18 @@ class TestOHLCData:
         expected = f"{dt.strftime('%Y-%m-%d %H:%M:%S')},0.00012300,0.00012700,0.00011900,0.00012500,1000000.50"
         assert result == expected
 
+    def test_formatting_ignores_sub_second_timestamps(self):
+        """Fractional timestamps format like the whole second they fall in."""
+        fractional = OHLCData(
+            timestamp=self.timestamp + 0.75,
+            open=1.0,
+            high=1.0,
+            low=1.0,
+            close=1.0,
+            volume=1.0,
+        )
+        assert fractional.to_csv_format()[:19] == self.ohlc.to_csv_format()[:19]
+
     def test_ohlcvt_format(self):
         """Test OHLCVT format output."""
         result = self.ohlc.to_ohlcvt_format()
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """Test cases for DexScraper main functionality."""
 
+import asyncio
+import io
+import json
+from contextlib import redirect_stdout
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from dexscraper import DexScraper
 from dexscraper.config import PresetConfigs
-from dexscraper.models import ExtractedTokenBatch, TokenProfile
+from dexscraper.models import ExtractedTokenBatch, TokenProfile, TradingPair
+from dexscraper.scraper import _CONNECT_HEADERS_PARAM
 
 
 class TestDexScraper:
@@ -382,6 +387,47 @@ class TestDexScraper:
         assert headers is not None
         assert "Origin" not in headers
 
+    @pytest.mark.asyncio
+    async def test_connect_reuses_ssl_context(self):
+        """The TLS context is built once and shared across reconnects."""
+        scraper = DexScraper(max_retries=1)
+
+        with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+            mock_connect.return_value = Mock()
+            await scraper._connect()
+            await scraper._connect()
+
+        first, second = (call.kwargs["ssl"] for call in mock_connect.call_args_list)
+        assert first is second
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled, expected", [(False, None), (True, "deflate")])
+    async def test_connect_compression_setting(self, enabled, expected):
+        """permessage-deflate is only negotiated when explicitly enabled."""
+        scraper = DexScraper(max_retries=1, websocket_compression=enabled)
+
+        with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+            mock_connect.return_value = Mock()
+            await scraper._connect()
+
+        assert mock_connect.call_args.kwargs["compression"] == expected
+
+    @pytest.mark.asyncio
+    async def test_connect_leaves_handshake_headers_to_websockets(self):
+        """Headers websockets sets itself must not be sent a second time."""
+        scraper = DexScraper(max_retries=1)
+
+        with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+            mock_connect.return_value = Mock()
+            await scraper._connect()
+
+        kwargs = mock_connect.call_args.kwargs
+        connect_headers = kwargs[_CONNECT_HEADERS_PARAM]
+        assert "Sec-WebSocket-Version" not in connect_headers
+        assert "Origin" not in connect_headers
+        assert "User-Agent" in connect_headers
+        assert kwargs["origin"] == "https://dexscreener.com"
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("header_param", ["additional_headers", "extra_headers"])
     async def test_connect_uses_detected_header_parameter(self, header_param):
@@ -438,6 +484,92 @@ class TestDexScraper:
         else:
             assert "proxy" not in kwargs
 
+    @pytest.mark.asyncio
+    async def test_stream_token_batches_reads_frames_from_one_connection(self):
+        """Streaming should parse each pushed frame without reconnecting."""
+        scraper = DexScraper()
+        mock_ws = Mock()
+        mock_ws.recv = AsyncMock(
+            side_effect=[b"handshake", b"frame-1", "ping", b"frame-2", b"frame-3"]
+        )
+        mock_ws.send = AsyncMock()
+        mock_ws.close = AsyncMock()
+        parsed = []
+
+        async def parse(message):
+            parsed.append(message)
+            return ExtractedTokenBatch(tokens=[TokenProfile(symbol="TEST")])
+
+        connect = AsyncMock(return_value=mock_ws)
+
+        with (
+            patch.object(scraper, "_connect", new=connect),
+            patch.object(scraper, "_parse_pairs_message", new=parse),
+        ):
+            stream = scraper.stream_token_batches()
+            batches = [await stream.__anext__() for _ in range(2)]
+            await stream.aclose()
+
+        assert connect.await_count == 1
+        assert parsed == [b"frame-1", b"frame-2"]
+        assert all(batch.tokens for batch in batches)
+        mock_ws.send.assert_awaited_once_with("pong")
+        mock_ws.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_token_batches_parses_one_frame_per_interval(self):
+        """Frames pushed inside an interval are dropped before parsing."""
+        scraper = DexScraper()
+        frames = [f"frame-{i}".encode() for i in range(10)]
+
+        async def recv():
+            if not frames_sent:
+                frames_sent.append(b"handshake")
+                return b"handshake"
+            if len(frames_sent) <= len(frames):
+                await asyncio.sleep(0.03)
+                frame = frames[len(frames_sent) - 1]
+                frames_sent.append(frame)
+                return frame
+            await asyncio.Event().wait()  # server stops pushing
+
+        frames_sent = []
+        mock_ws = Mock()
+        mock_ws.recv = recv
+        mock_ws.close = AsyncMock()
+        parsed = []
+
+        async def parse(message):
+            parsed.append(message)
+            return ExtractedTokenBatch(tokens=[TokenProfile(symbol="TEST")])
+
+        connect = AsyncMock(return_value=mock_ws)
+
+        with (
+            patch.object(scraper, "_connect", new=connect),
+            patch.object(scraper, "_parse_pairs_message", new=parse),
+        ):
+            batches = [
+                batch async for batch in scraper.stream_token_batches(interval=0.2)
+            ]
+
+        # First frame at once, then the newest frame per interval; the stream
+        # ends once a whole interval passes without a push
+        assert len(batches) == len(parsed) == 3
+        assert parsed[0] == b"frame-0"
+        assert parsed[-1] == b"frame-9"
+        assert connect.await_count == 1
+        mock_ws.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_token_batches_raises_when_connect_fails(self):
+        """Streaming should surface connection failure to the caller."""
+        scraper = DexScraper()
+
+        with patch.object(scraper, "_connect", new=AsyncMock(return_value=None)):
+            with pytest.raises(ConnectionError):
+                await scraper.stream_token_batches().__anext__()
+
     @pytest.mark.asyncio
     async def test_connect_retries_and_recovers(self):
         """Connection should retry after failure and reset retry counter on success."""
@@ -498,6 +630,92 @@ class TestDexScraper:
         assert batch.tokens[0].symbol == "TEST"
         websocket.close.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_extract_token_data_answers_ping_before_pairs(self):
+        """Text pings between frames are answered and skipped."""
+        scraper = DexScraper()
+        websocket = Mock()
+        websocket.recv = AsyncMock(
+            side_effect=[b"handshake", "ping", b"xxpairs" + b"A" * 64]
+        )
+        websocket.send = AsyncMock()
+        websocket.close = AsyncMock()
+
+        with (
+            patch.object(scraper, "_connect", new=AsyncMock(return_value=websocket)),
+            patch.object(
+                scraper, "_extract_all_tokens", new=AsyncMock(return_value=[])
+            ) as extract_mock,
+        ):
+            await scraper.extract_token_data()
+
+        websocket.send.assert_awaited_once_with("pong")
+        extract_mock.assert_awaited_once()
+
+    def test_find_pairs_section_reuses_previous_offset(self):
+        """The cached tag offset is reused only while it is still the first match."""
+        scraper = DexScraper()
+        frame = b"\x00\n1.3.0\n\x05pairs" + b"\x00" * 32 + b"pairs"
+
+        assert scraper._find_pairs_section(frame) == 9
+        assert scraper._pairs_offset == 9
+        assert scraper._find_pairs_section(frame) == 9
+
+        shifted = b"pairs" + frame
+        assert scraper._find_pairs_section(shifted) == 0
+        assert scraper._find_pairs_section(b"no tag") == -1
+        assert scraper._pairs_offset is None
+
+    @pytest.mark.asyncio
+    async def test_output_pairs_json_writes_one_line(self):
+        """JSON pair output is a single compact line per batch."""
+        scraper = DexScraper()
+        pair = TradingPair(
+            chain="solana",
+            protocol="raydium",
+            pair_address="pair",
+            base_token_name="Token",
+            base_token_symbol="TKN",
+            base_token_address="base",
+        )
+        buffer = io.StringIO()
+
+        with redirect_stdout(buffer):
+            await scraper._output_pairs([pair], "json")
+
+        lines = buffer.getvalue().splitlines()
+        assert len(lines) == 1
+        payload = json.loads(lines[0])
+        assert payload["type"] == "pairs"
+        assert payload["pairs"][0]["baseTokenSymbol"] == "TKN"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format_type", ["ohlc", "mt5"])
+    async def test_output_pairs_text_formats_write_batch_once(self, format_type):
+        """OHLC/MT5 pair output is written as one block per batch."""
+        scraper = DexScraper()
+        pairs = [
+            TradingPair(
+                chain="solana",
+                protocol="raydium",
+                pair_address=f"pair{i}",
+                base_token_name="Token",
+                base_token_symbol=f"TKN{i}",
+                base_token_address="base",
+            )
+            for i in range(3)
+        ]
+        stdout = Mock()
+
+        with patch("sys.stdout", stdout):
+            await scraper._output_pairs(pairs, format_type)
+
+        stdout.write.assert_called_once()
+        lines = stdout.write.call_args.args[0].splitlines()
+        assert len(lines) == 3
+        if format_type == "ohlc":
+            assert [line.split(",")[0] for line in lines] == ["TKN0", "TKN1", "TKN2"]
+
     def test_extract_token_data_sync_uses_asyncio_run(self):
         """Sync API should delegate to asyncio.run when no loop is running."""
         scraper = DexScraper()